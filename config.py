@@ -8,6 +8,11 @@ load_dotenv()
 NAVIDROME_URL = os.getenv("NAVIDROME_URL", "https://listen.wintermute.lol")
 NAVIDROME_USER = os.getenv("NAVIDROME_USER", "jack")
 NAVIDROME_PASS = os.getenv("NAVIDROME_PASS", "")
+# Concurrent album-list page requests when loading the library (1-8).
+# Pages are fetched speculatively in rounds of this many 500-album pages,
+# so each load can request up to NAVIDROME_PARALLELISM - 1 pages past the
+# end of the library (empty/short responses, but still server round trips)
+NAVIDROME_PARALLELISM = max(1, min(8, int(os.getenv("NAVIDROME_PARALLELISM", "4"))))
 
 # Display settings
 SCREEN_WIDTH = 320
@@ -38,9 +43,16 @@ BTN_DOWN = 22
 BTN_SELECT = 23
 BTN_BACK = 27
 
+# Bluetooth: reconnect previously paired headphones at startup
+BLUETOOTH_AUTO_RECONNECT = os.getenv("BLUETOOTH_AUTO_RECONNECT", "0").lower() in ("1", "true", "yes")
+
 # Battery monitoring
 LBO_PIN = 4  # PowerBoost Low Battery Output
 
 # Playback settings
 DEFAULT_VOLUME = 70
 BUFFER_SIZE = 8192
+# VLC network buffer per stream in milliseconds (lower = faster start, higher = fewer dropouts)
+NETWORK_CACHING_MS = int(os.getenv("NETWORK_CACHING_MS", "30000"))
+# VLC audio resampler ("speex" is much cheaper than "soxr" on a Pi; empty = VLC default)
+VLC_RESAMPLER = os.getenv("VLC_RESAMPLER", "")
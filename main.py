@@ -1,5 +1,6 @@
 
 import curses
+import config
 from player.navidrome import NavidromeClient
 from ui.screens import (MainMenuScreen, AlbumBrowserScreen, SongListScreen, NowPlayingScreen,
                         BluetoothSettingsScreen, ArtistBrowserScreen, PlaylistBrowserScreen)
@@ -18,19 +19,23 @@ class MusicPlayerApp:
         logger.info("Connecting to Navidrome client")
         self.client = NavidromeClient()
 
-        # Try to initialize audio player, fall back to mock if no audio device
-        try:
-            logger.info("Initializing audio player")
-            from player.audio import AudioPlayer
-            self.audio = AudioPlayer()
-        except Exception as e:
-            logger.warning(f"Failed to initialize audio player, using mock: {e}")
-            from player.audio_mock import AudioPlayer
-            self.audio = AudioPlayer()
+        # Reconnect known headphones first so the audio player finds their sink
+        if config.BLUETOOTH_AUTO_RECONNECT:
+            from player.bluetooth import BluetoothManager
+            reconnected = BluetoothManager().reconnect_known()
+            logger.info(f"Bluetooth auto-reconnect: {reconnected or 'no devices'}")
+
+        # Initialize audio player (falls back to mock if no audio device)
+        logger.info("Initializing audio player")
+        from player.audio import make_player
+        self.audio = make_player()
+        logger.info(f"Audio backend: {type(self.audio).__module__}")
 
         # Setup curses
         logger.debug("Setting up curses interface")
         curses.curs_set(0)
+        # Cursor is hidden - don't make refresh() move it back after each frame
+        self.stdscr.leaveok(True)
         self.stdscr.nodelay(1)
         self.stdscr.timeout(100)
         init_colors()
@@ -85,7 +90,7 @@ class MusicPlayerApp:
                             result = menu.handle_input(key)
                     
                     # Check for button actions
-                    if hasattr(menu, '_pending_action') and menu._pending_action:
+                    if menu._pending_action:
                         result = menu._pending_action
                         menu._pending_action = None
                     
@@ -142,7 +147,7 @@ class MusicPlayerApp:
         # Use cached albums if available, otherwise fetch from Navidrome
         if self.cached_albums is None:
             logger.info("Fetching albums from Navidrome")
-            albums = self.client.get_all_albums()
+            albums = self.client.get_all_albums_parallel()
             self.cached_albums = albums
             logger.info(f"Cached {len(albums)} albums")
         else:
@@ -178,7 +183,7 @@ class MusicPlayerApp:
                     result = browser.handle_input(key)
 
             # Check for button actions
-            if hasattr(browser, '_pending_action') and browser._pending_action:
+            if browser._pending_action:
                 result = browser._pending_action
                 browser._pending_action = None
 
@@ -234,7 +239,7 @@ class MusicPlayerApp:
                     result = song_list.handle_input(key)
 
             # Check for button actions
-            if hasattr(song_list, '_pending_action') and song_list._pending_action:
+            if song_list._pending_action:
                 result = song_list._pending_action
                 song_list._pending_action = None
 
@@ -286,7 +291,7 @@ class MusicPlayerApp:
                     result = now_playing.handle_input(key)
 
             # Check for button actions
-            if hasattr(now_playing, '_pending_action') and now_playing._pending_action:
+            if now_playing._pending_action:
                 result = now_playing._pending_action
                 now_playing._pending_action = None
 
@@ -327,7 +332,7 @@ class MusicPlayerApp:
                     result = bt_settings.handle_input(key)
 
             # Check for button actions
-            if hasattr(bt_settings, '_pending_action') and bt_settings._pending_action:
+            if bt_settings._pending_action:
                 result = bt_settings._pending_action
                 bt_settings._pending_action = None
 
@@ -377,7 +382,7 @@ class MusicPlayerApp:
                     result = browser.handle_input(key)
 
             # Check for button actions
-            if hasattr(browser, '_pending_action') and browser._pending_action:
+            if browser._pending_action:
                 result = browser._pending_action
                 browser._pending_action = None
 
@@ -432,7 +437,7 @@ class MusicPlayerApp:
                     result = browser.handle_input(key)
 
             # Check for button actions
-            if hasattr(browser, '_pending_action') and browser._pending_action:
+            if browser._pending_action:
                 result = browser._pending_action
                 browser._pending_action = None
 
@@ -491,7 +496,7 @@ class MusicPlayerApp:
                     result = browser.handle_input(key)
 
             # Check for button actions
-            if hasattr(browser, '_pending_action') and browser._pending_action:
+            if browser._pending_action:
                 result = browser._pending_action
                 browser._pending_action = None
 
@@ -546,7 +551,7 @@ class MusicPlayerApp:
                     result = song_list.handle_input(key)
 
             # Check for button actions
-            if hasattr(song_list, '_pending_action') and song_list._pending_action:
+            if song_list._pending_action:
                 result = song_list._pending_action
                 song_list._pending_action = None
 
@@ -585,8 +590,9 @@ class MusicPlayerApp:
         self.button_controller.stop()
         # Clean up current screen if it has cleanup method
         if self.current_screen and hasattr(self.current_screen, 'cleanup'):
-            logger.debug(f"Cleaning up screen: {type(self.current_screen).__name__}")
+            logger.debug("Cleaning up screen: %s", type(self.current_screen).__name__)
             self.current_screen.cleanup()
+        self.client.close()
         logger.info("Cleanup complete")
 
 def main(stdscr):
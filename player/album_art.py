@@ -1,22 +1,38 @@
 import subprocess
 import tempfile
 import os
+import importlib.util
 import requests
+from collections import OrderedDict
 from pathlib import Path
-try:
-    from PIL import Image
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+# PIL is only needed once a cover is shown - check for it here, but leave
+# the (slow) import to get_ascii_art so it stays off the startup path
+PIL_AVAILABLE = importlib.util.find_spec("PIL") is not None
 
 class AlbumArtDisplay:
     """Display album art in terminal using chafa"""
 
+    # Downloaded covers kept on disk, so tracks from a recently shown
+    # album reuse the file instead of downloading it again
+    ART_CACHE_SIZE = 16
+    # Give up on covers larger than this rather than fill /tmp with them
+    MAX_ART_BYTES = 2 * 1024 * 1024
+
     def __init__(self):
         self.temp_dir = tempfile.gettempdir()
         self.current_art_file = None
+        self._art_files = OrderedDict()  # album_id -> temp file path, oldest first
         self.chafa_available = self._check_chafa()
 
+        # Keep-alive connection pool so consecutive covers from the same
+        # server skip the TCP/TLS handshake
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Images are already compressed - don't ask the server to gzip them
+        self.session.headers.update({'Accept-Encoding': 'identity'})
+
     def _check_chafa(self):
         """Check if chafa is installed"""
         try:
@@ -28,34 +44,47 @@ class AlbumArtDisplay:
             return False
 
     def download_cover_art(self, url, album_id):
-        """Download cover art from URL"""
+        """Download cover art from URL (or reuse this album's cached file)"""
         if not url:
             return None
 
-        try:
-            # Create temp file path
-            temp_path = os.path.join(self.temp_dir, f"cover_{album_id}.jpg")
-
-            # Download image
-            response = requests.get(url, timeout=5)
-            response.raise_for_status()
-
-            # Save to temp file
-            with open(temp_path, 'wb') as f:
-                f.write(response.content)
+        # Keyed by album id - the URL carries a rotating auth salt
+        cached = self._art_files.get(album_id)
+        if cached and os.path.exists(cached):
+            self._art_files.move_to_end(album_id)
+            self.current_art_file = cached
+            return cached
 
-            # Clean up old cover art
-            if self.current_art_file and os.path.exists(self.current_art_file):
-                try:
-                    os.remove(self.current_art_file)
-                except:
-                    pass
+        temp_path = None
+        try:
+            # Download image, streaming it straight to a fresh temp file
+            # instead of buffering the whole body in memory first
+            with self.session.get(url, stream=True, timeout=5) as response:
+                response.raise_for_status()
+                with tempfile.NamedTemporaryFile(delete=False, dir=self.temp_dir,
+                                                 prefix=f"cover_{album_id}_",
+                                                 suffix=".jpg") as f:
+                    temp_path = f.name
+                    size = 0
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        size += len(chunk)
+                        if size > self.MAX_ART_BYTES:
+                            raise ValueError(f"cover art over {self.MAX_ART_BYTES} bytes")
+                        f.write(chunk)
+
+            # Cache the new cover, dropping the least recently shown ones
+            self._unlink(self._art_files.pop(album_id, None))
+            self._art_files[album_id] = temp_path
+            while len(self._art_files) > self.ART_CACHE_SIZE:
+                self._unlink(self._art_files.popitem(last=False)[1])
 
             self.current_art_file = temp_path
             return temp_path
 
         except Exception as e:
             print(f"Error downloading cover art: {e}")
+            # Don't leave a partial download behind
+            self._unlink(temp_path)
             return None
 
     def display_in_terminal(self, image_path, width=40, height=20):
@@ -119,13 +148,19 @@ class AlbumArtDisplay:
             return self._create_placeholder(width, height, "No album art")
 
         try:
+            from PIL import Image
+
             # Open and resize image
             img = Image.open(image_path)
+            # JPEGs decode straight to grayscale at the smallest 1/2, 1/4 or
+            # 1/8 scale still covering the target (no-op for other formats)
+            img.draft('L', (width, height))
             img = img.convert('L')  # Convert to grayscale
 
             # Resize to fit ASCII dimensions
             # Each character is roughly 2:1 (height:width) so adjust accordingly
-            img = img.resize((width, height), Image.Resampling.LANCZOS)
+            # (area averaging is plenty for a few dozen character cells)
+            img = img.resize((width, height), Image.Resampling.BOX)
 
             # ASCII characters from darkest to lightest
             ascii_chars = " .'`^\",:;Il!i><~+_-?][}{1)(|\\/tfjrxnuvczXYUJCLQ0OZmwqpdbkhao*#MW&8%B@$"
@@ -167,10 +202,18 @@ class AlbumArtDisplay:
         lines.append("└" + "─" * (width - 2) + "┘")
         return lines
 
+    @staticmethod
+    def _unlink(path):
+        """Remove a file if it exists (single unlink, no stat)"""
+        try:
+            os.unlink(path)
+        except (OSError, TypeError):
+            pass
+
     def cleanup(self):
         """Clean up temporary files"""
-        if self.current_art_file and os.path.exists(self.current_art_file):
-            try:
-                os.remove(self.current_art_file)
-            except:
-                pass
+        for path in self._art_files.values():
+            self._unlink(path)
+        self._art_files.clear()
+        self.current_art_file = None
+        self.session.close()
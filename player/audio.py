@@ -1,71 +1,96 @@
+import logging
 import os
 import subprocess
+import threading
 import time
+import config
+from player.audio_base import AudioBackend, BackendUnavailable
 from utils.logger import get_logger
 
 logger = get_logger("audio")
 
-# Set library path before importing vlc
-# Common locations for libvlc on Raspberry Pi
-possible_paths = [
-    '/usr/lib/arm-linux-gnueabihf',
-    '/usr/lib/aarch64-linux-gnu',
-    '/usr/lib/x86_64-linux-gnu',
-    '/usr/lib',
-]
-
-for path in possible_paths:
-    if os.path.exists(path):
-        current_ld_path = os.environ.get('LD_LIBRARY_PATH', '')
-        if current_ld_path:
-            os.environ['LD_LIBRARY_PATH'] = f"{path}:{current_ld_path}"
-        else:
-            os.environ['LD_LIBRARY_PATH'] = path
-        break
-
-# Try importing vlc and log any errors
-try:
-    import vlc
-    vlc_import_success = True
-    vlc_import_error = None
-except Exception as e:
-    vlc_import_success = False
-    vlc_import_error = str(e)
-    vlc = None
+# vlc is imported on first use so the app still starts (and can fall back
+# to another backend) on a system without libvlc
+vlc = None
+
+
+def _load_vlc():
+    """Import python-vlc, raising BackendUnavailable if it can't be loaded"""
+    global vlc
+    if vlc is not None:
+        return vlc
+
+    # Set library path before importing vlc
+    # Common locations for libvlc on Raspberry Pi
+    possible_paths = [
+        '/usr/lib/arm-linux-gnueabihf',
+        '/usr/lib/aarch64-linux-gnu',
+        '/usr/lib/x86_64-linux-gnu',
+        '/usr/lib',
+    ]
+
+    for path in possible_paths:
+        if os.path.exists(path):
+            current_ld_path = os.environ.get('LD_LIBRARY_PATH', '')
+            if current_ld_path:
+                os.environ['LD_LIBRARY_PATH'] = f"{path}:{current_ld_path}"
+            else:
+                os.environ['LD_LIBRARY_PATH'] = path
+            break
+
+    try:
+        import vlc as vlc_module
+    except Exception as e:
+        logger.error("VLC import error: %s", e)
+        raise BackendUnavailable(f"python-vlc could not be loaded: {e}") from e
+
+    vlc = vlc_module
+    _debug_vlc()
+    return vlc
 
 # Debug VLC loading
 def _debug_vlc():
     """Debug VLC library loading"""
     logger.info("=== VLC Debug Info ===")
-    logger.info(f"VLC import success: {vlc_import_success}")
-    if not vlc_import_success:
-        logger.error(f"VLC import error: {vlc_import_error}")
-        return
-
-    logger.info(f"LD_LIBRARY_PATH: {os.environ.get('LD_LIBRARY_PATH', 'NOT SET')}")
-    if vlc:
-        logger.info(f"VLC module path: {vlc.__file__}")
+    logger.info("LD_LIBRARY_PATH: %s", os.environ.get('LD_LIBRARY_PATH', 'NOT SET'))
+    logger.info("VLC module path: %s", vlc.__file__)
 
     # Try to get VLC version
     try:
-        if vlc:
-            logger.info(f"VLC version: {vlc.libvlc_get_version()}")
+        logger.info("VLC version: %s", vlc.libvlc_get_version())
     except Exception as e:
-        logger.warning(f"Could not get VLC version: {e}")
+        logger.warning("Could not get VLC version: %s", e)
 
     # Try to find libvlc.so
     try:
         import ctypes.util
         libvlc_path = ctypes.util.find_library('vlc')
-        logger.info(f"libvlc.so location: {libvlc_path}")
+        logger.info("libvlc.so location: %s", libvlc_path)
     except Exception as e:
-        logger.error(f"VLC debug error: {e}")
+        logger.error("VLC debug error: %s", e)
+
+class AudioPlayer(AudioBackend):
+    def __init__(self, network_caching_ms=None, resampler=None):
+        """
+        Args:
+            network_caching_ms: VLC network buffer per stream in milliseconds.
+                Lower values start playback sooner, higher values ride out
+                network hiccups. Defaults to config.NETWORK_CACHING_MS.
+            resampler: VLC audio resampler module (e.g. "speex", "ugly").
+                Defaults to config.VLC_RESAMPLER; empty keeps VLC's default.
+        """
+        logger.info("=== AudioPlayer Init ===")
+        _load_vlc()
 
-_debug_vlc()
+        if network_caching_ms is None:
+            network_caching_ms = config.NETWORK_CACHING_MS
+        self.network_caching_ms = network_caching_ms
 
-class AudioPlayer:
-    def __init__(self):
-        logger.info("=== AudioPlayer Init ===")
+        if resampler is None:
+            resampler = config.VLC_RESAMPLER
+
+        # Bring-up diagnostics (per-track pactl checks) - off unless MUSICPLAYER_DEBUG=1
+        self.debug = os.getenv('MUSICPLAYER_DEBUG', '0') not in ('', '0')
 
         # Try to set Bluetooth as default sink before initializing VLC
         self._ensure_bluetooth_sink()
@@ -78,15 +103,26 @@ class AudioPlayer:
 
             # Create VLC instance with working args
             # Note: Some args like --audio-buffer, --clock-jitter, --audio-resampler
-            # cause Instance() to return None on this VLC version, so we use minimal args
-            self.instance = vlc.Instance(
+            # cause Instance() to return None on some VLC versions, so the base
+            # args are minimal and any extras are retried without on failure
+            # Network caching is applied per media in play() so it can be tuned at runtime
+            base_args = [
                 '--aout=pulse',              # Use PulseAudio for audio output
                 '--verbose=0',               # Minimal logging
-                '--network-caching=30000',   # 30 second buffer for streaming (reduce choppiness)
                 '--file-caching=10000',      # 10 second file cache
                 '--live-caching=10000'       # 10 second live stream cache
-            )
-            logger.info(f"VLC instance created: {self.instance}")
+            ]
+            extra_args = []
+            if resampler:
+                # A cheaper resampler (speex/ugly) saves a lot of CPU on a Pi
+                # when the stream rate differs from the sink rate
+                extra_args.append(f'--audio-resampler={resampler}')
+
+            self.instance = vlc.Instance(*base_args, *extra_args)
+            if self.instance is None and extra_args:
+                logger.warning("VLC rejected %s - retrying with default args", extra_args)
+                self.instance = vlc.Instance(*base_args)
+            logger.info("VLC instance created: %s", self.instance)
 
             if self.instance is None:
                 raise Exception("VLC Instance() returned None - VLC libraries not properly installed")
@@ -100,7 +136,7 @@ class AudioPlayer:
             self.audio_available = True
             logger.info("✓ Audio initialized with VLC + PulseAudio backend")
         except Exception as e:
-            logger.error(f"Could not initialize audio device: {e}")
+            logger.error("Could not initialize audio device: %s", e)
             logger.warning("Running in silent mode - no audio output available")
             self.audio_available = False
             raise  # Re-raise to trigger fallback to mock player
@@ -109,10 +145,17 @@ class AudioPlayer:
         self.is_playing = False
         self.is_paused = False
         self.volume = 100  # VLC uses 0-200 scale (100 = normal, 200 = amplified)
+        self._play_generation = 0  # Bumped per play() so stale watchers/events are ignored
+        self._finished_generation = None  # Generation whose media reached its end
+        # Event manager of the current media - holds the ctypes callback, so
+        # it must stay referenced until the next play()/stop() detaches it
+        self._media_events = None
+        self._vol_timer = None  # Pending debounced audio_set_volume()
+        self._vol_lock = threading.Lock()
 
         if self.audio_available:
             self.player.audio_set_volume(self.volume)
-            logger.info(f"Initial volume set to {self.volume}")
+            logger.info("Initial volume set to %s", self.volume)
 
     def _ensure_bluetooth_sink(self):
         """Ensure Bluetooth sink is set as default if available"""
@@ -133,30 +176,40 @@ class AudioPlayer:
                 parts = line.split()
                 if len(parts) >= 2 and 'bluez' in parts[1].lower():
                     bluez_sink = parts[1]
-                    logger.info(f"Found Bluetooth sink: {bluez_sink}")
+                    logger.info("Found Bluetooth sink: %s", bluez_sink)
                     # Set as default
                     subprocess.run(['pactl', 'set-default-sink', bluez_sink], timeout=2)
-                    logger.info(f"Set {bluez_sink} as default audio sink")
+                    logger.info("Set %s as default audio sink", bluez_sink)
 
                     # Set the PULSE_SINK environment variable for this process
                     os.environ['PULSE_SINK'] = bluez_sink
-                    logger.info(f"Set PULSE_SINK environment variable to {bluez_sink}")
+                    logger.info("Set PULSE_SINK environment variable to %s", bluez_sink)
                     return
 
             logger.info("No Bluetooth sink found - using default audio sink")
         except Exception as e:
-            logger.warning(f"Could not set Bluetooth sink: {e}")
+            logger.warning("Could not set Bluetooth sink: %s", e)
+
+    def set_network_caching(self, ms):
+        """Set the network buffer (in milliseconds) used for subsequent streams"""
+        self.network_caching_ms = max(0, int(ms))
 
-    def play(self, stream_url, song_info):
-        """Stream a song from URL"""
+    def play(self, stream_url, song_info, network_caching_ms=None):
+        """Stream a song from URL
+
+        Args:
+            stream_url: URL to stream
+            song_info: Song metadata dict
+            network_caching_ms: Optional per-stream override of the network buffer
+        """
         # Set current_song immediately so UI shows info even if playback fails
         self.current_song = song_info
 
         try:
-            logger.info(f"=== Attempting to stream ===")
-            logger.info(f"Song: {song_info.get('title', 'Unknown')}")
-            logger.info(f"Artist: {song_info.get('artist', 'Unknown')}")
-            logger.debug(f"URL: {stream_url}")
+            logger.info("=== Attempting to stream ===")
+            logger.info("Song: %s", song_info.get('title', 'Unknown'))
+            logger.info("Artist: %s", song_info.get('artist', 'Unknown'))
+            logger.debug("URL: %s", stream_url)
 
             if not self.audio_available:
                 logger.warning("⚠ Audio not available - simulating playback")
@@ -164,11 +217,23 @@ class AudioPlayer:
                 self.is_paused = False
                 return True
 
-            # Stop current playback
-            self.stop()
-
+            # Swap the media on the running player instead of calling stop()
+            # first - set_media() switches tracks without tearing down the
+            # audio output, which avoids a PulseAudio/A2DP sink reopen per song
             logger.debug("Creating media from URL...")
             media = self.instance.media_new(stream_url)
+            if network_caching_ms is None:
+                network_caching_ms = self.network_caching_ms
+            media.add_option(f':network-caching={network_caching_ms}')
+            self._play_generation += 1
+            generation = self._play_generation
+            # Let VLC tell us when this track ends instead of polling its
+            # state - the event is tagged with the track's generation, so a
+            # late end event from the previous media can't finish this one
+            self._detach_media_events()
+            self._media_events = media.event_manager()
+            self._media_events.event_attach(
+                vlc.EventType.MediaStateChanged, self._on_media_state, generation)
             self.player.set_media(media)
 
             logger.info("Starting stream playback...")
@@ -177,40 +242,56 @@ class AudioPlayer:
             self.is_playing = True
             self.is_paused = False
 
-            # Wait for VLC to start playing and check state
-            for i in range(10):  # Check for up to 5 seconds
-                time.sleep(0.5)
-                state = self.player.get_state()
-                logger.debug(f"VLC state after {(i+1)*0.5}s: {state}")
-
-                # VLC states: 0=NothingSpecial, 1=Opening, 2=Buffering, 3=Playing, 4=Paused, 5=Stopped, 6=Ended, 7=Error
-                if state == 3:  # Playing
-                    logger.info("✓ VLC is now playing!")
-                    break
-                elif state == 7:  # Error
-                    logger.error("✗ VLC encountered an error!")
-                    break
-
-            # Check if audio stream was created in PulseAudio
-            result = subprocess.run(['pactl', 'list', 'short', 'sink-inputs'],
-                                  capture_output=True, text=True, timeout=2)
-            if result.stdout.strip():
-                logger.debug(f"✓ Audio stream active: {result.stdout.strip()}")
-            else:
-                logger.warning("No PulseAudio sink-input detected!")
-                logger.warning("This could mean VLC is not outputting to PulseAudio.")
-
-                # Check what audio output VLC is using
-                logger.debug(f"VLC audio output module: {self.player.audio_output_device_enum()}")
+            # Watch VLC's startup state in the background so the UI isn't
+            # blocked for up to 5 seconds on every track change
+            threading.Thread(target=self._watch_startup,
+                             args=(generation,),
+                             daemon=True).start()
 
             return True
 
         except Exception as e:
-            logger.error(f"✗ Error streaming song: {e}", exc_info=True)
+            logger.error("✗ Error streaming song: %s", e, exc_info=True)
             # Keep current_song set so UI can display info
             self.is_playing = False
             return False
 
+    def _watch_startup(self, generation):
+        """Log VLC's state until the stream starts playing or fails (background thread)"""
+        for i in range(10):  # Check for up to 5 seconds
+            time.sleep(0.5)
+            if generation != self._play_generation:
+                return  # Another track was started - stop watching this one
+            state = self.player.get_state()
+            logger.debug("VLC state after %ss: %s", (i + 1) * 0.5, state)
+
+            # VLC states: 0=NothingSpecial, 1=Opening, 2=Buffering, 3=Playing, 4=Paused, 5=Stopped, 6=Ended, 7=Error
+            if state == 3:  # Playing
+                logger.info("✓ VLC is now playing!")
+                break
+            elif state == 7:  # Error
+                logger.error("✗ VLC encountered an error!")
+                break
+
+        # Check if audio stream was created in PulseAudio. This forks pactl
+        # on every track, so it only runs in debug mode.
+        if self.debug:
+            self._log_sink_inputs()
+
+    def _log_sink_inputs(self):
+        """Log whether VLC's stream shows up as a PulseAudio sink-input (diagnostic)"""
+        result = subprocess.run(['pactl', 'list', 'short', 'sink-inputs'],
+                              capture_output=True, text=True, timeout=2)
+        if result.stdout.strip():
+            logger.debug("✓ Audio stream active: %s", result.stdout.strip())
+        else:
+            logger.warning("No PulseAudio sink-input detected!")
+            logger.warning("This could mean VLC is not outputting to PulseAudio.")
+
+            # Check what audio output VLC is using (only worth querying if it gets logged)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("VLC audio output module: %s", self.player.audio_output_device_enum())
+
     def pause(self):
         """Pause playback"""
         if not self.audio_available:
@@ -233,18 +314,12 @@ class AudioPlayer:
             self.player.pause()  # VLC's pause() toggles, so call again to unpause
             self.is_paused = False
 
-    def toggle_pause(self):
-        """Toggle pause/play"""
-        if self.is_paused:
-            self.unpause()
-        else:
-            self.pause()
-
     def stop(self):
         """Stop playback"""
         if self.audio_available:
             logger.info("Stopping playback")
             self.player.stop()
+            self._detach_media_events()
 
         self.is_playing = False
         self.is_paused = False
@@ -252,26 +327,43 @@ class AudioPlayer:
     def set_volume(self, volume):
         """Set volume (0.0 to 2.0)"""
         # Convert 0.0-2.0 to 0-200 for VLC (allows amplification above 100%)
-        self.volume = max(0, min(200, int(volume * 100)))
-        logger.debug(f"Setting volume to {self.volume}")
-        if self.audio_available:
-            self.player.audio_set_volume(self.volume)
+        self._change_volume(int(volume * 100))
 
     def volume_up(self, step=10):
         """Increase volume"""
-        old_volume = self.volume
-        self.volume = max(0, min(200, self.volume + step))
-        logger.debug(f"Volume up: {old_volume} -> {self.volume}")
-        if self.audio_available:
-            self.player.audio_set_volume(self.volume)
+        self._change_volume(self.volume + step)
 
     def volume_down(self, step=10):
         """Decrease volume"""
-        old_volume = self.volume
-        self.volume = max(0, min(200, self.volume - step))
-        logger.debug(f"Volume down: {old_volume} -> {self.volume}")
-        if self.audio_available:
-            self.player.audio_set_volume(self.volume)
+        self._change_volume(self.volume - step)
+
+    def _change_volume(self, volume):
+        """Update the volume now and apply it to VLC after a short debounce
+
+        self.volume changes immediately so the UI shows the new level, but
+        audio_set_volume() (a PulseAudio round-trip) only runs once a burst
+        of button presses has settled.
+        """
+        new_volume = max(0, min(200, volume))
+        if new_volume == self.volume:
+            return  # Already at that level/limit - skip the PulseAudio round-trip
+        logger.debug("Volume: %s -> %s", self.volume, new_volume)
+        self.volume = new_volume
+        if not self.audio_available:
+            return
+
+        with self._vol_lock:
+            if self._vol_timer is not None:
+                self._vol_timer.cancel()
+            self._vol_timer = threading.Timer(0.02, self._flush_volume)
+            self._vol_timer.daemon = True
+            self._vol_timer.start()
+
+    def _flush_volume(self):
+        """Apply the latest volume to VLC (debounce timer callback)"""
+        with self._vol_lock:
+            self._vol_timer = None
+        self.player.audio_set_volume(self.volume)
 
     def get_position(self):
         """Get current playback position in seconds"""
@@ -287,8 +379,47 @@ class AudioPlayer:
         """Check if current song has finished"""
         if not self.audio_available:
             return False
-        if self.is_playing:
-            state = self.player.get_state()
-            # VLC states: 0=NothingSpecial, 1=Opening, 2=Buffering, 3=Playing, 4=Paused, 5=Stopped, 6=Ended, 7=Error
-            return state == 6  # vlc.State.Ended
-        return False
+        return self.is_playing and self._finished_generation == self._play_generation
+
+    def _detach_media_events(self):
+        """Stop listening to the previous media's state changes"""
+        if self._media_events is not None:
+            self._media_events.event_detach(vlc.EventType.MediaStateChanged)
+            self._media_events = None
+
+    def _on_media_state(self, event, generation):
+        """VLC event callback (runs on a VLC thread) - mark the track as finished"""
+        if event.u.new_state == vlc.State.Ended and generation == self._play_generation:
+            self._finished_generation = generation
+
+
+def make_player(name=None):
+    """Create an audio player for the selected backend
+
+    Args:
+        name: Backend name ("vlc", "local" or "mock"). Defaults to the
+              MUSICPLAYER_BACKEND environment variable, then "vlc".
+
+    The silent mock player is always tried last, so the app keeps running
+    when no audio device is available.
+    """
+    name = (name or os.getenv('MUSICPLAYER_BACKEND') or 'vlc').lower()
+    candidates = [name] if name == 'mock' else [name, 'mock']
+
+    for candidate in candidates:
+        try:
+            if candidate == 'vlc':
+                return AudioPlayer()
+            if candidate == 'local':
+                from player.audio_local import LocalAudioPlayer
+                return LocalAudioPlayer()
+            if candidate == 'mock':
+                from player.audio_mock import AudioPlayer as MockAudioPlayer
+                return MockAudioPlayer()
+            logger.error("Unknown audio backend: %s", candidate)
+        except BackendUnavailable as e:
+            logger.warning("Audio backend '%s' not installed: %s", candidate, e)
+        except Exception as e:
+            logger.warning("Audio backend '%s' unavailable: %s", candidate, e)
+
+    raise RuntimeError("No audio backend available")
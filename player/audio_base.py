@@ -0,0 +1,64 @@
+"""
+Audio Backend Interface - shared base class for all audio players
+"""
+
+from abc import ABC, abstractmethod
+
+
+class BackendUnavailable(Exception):
+    """Raised when an audio backend's library (vlc, pygame) can't be imported"""
+
+
+class AudioBackend(ABC):
+    """Base class for audio players (VLC, local pygame, mock)
+
+    Subclasses implement the backend-specific playback calls and keep
+    current_song / is_playing / is_paused / volume up to date.
+    """
+
+    current_song = None
+    is_playing = False
+    is_paused = False
+
+    @abstractmethod
+    def play(self, source, song_info=None):
+        """Start playing source (stream URL or file path). Returns True on success."""
+
+    @abstractmethod
+    def pause(self):
+        """Pause playback"""
+
+    @abstractmethod
+    def unpause(self):
+        """Resume playback"""
+
+    @abstractmethod
+    def stop(self):
+        """Stop playback"""
+
+    @abstractmethod
+    def set_volume(self, volume):
+        """Set volume (backend-specific scale)"""
+
+    @abstractmethod
+    def get_position(self):
+        """Get current playback position in seconds"""
+
+    @abstractmethod
+    def is_finished(self):
+        """Check if current song has finished"""
+
+    def toggle_pause(self):
+        """Toggle pause/play"""
+        if self.is_paused:
+            self.unpause()
+        else:
+            self.pause()
+
+    def volume_up(self, step=0.1):
+        """Increase volume"""
+        self.set_volume(self.volume + step)
+
+    def volume_down(self, step=0.1):
+        """Decrease volume"""
+        self.set_volume(self.volume - step)
@@ -2,16 +2,53 @@
 Local Audio Player - plays files directly from filesystem
 """
 
-import pygame
 import os
+from player.audio_base import AudioBackend, BackendUnavailable
+
+# Imported on first use so pygame's SDL libraries are only loaded when
+# this backend is actually selected
+pygame = None
+
+
+def _load_pygame():
+    """Import pygame, raising BackendUnavailable if it isn't installed"""
+    global pygame
+    if pygame is None:
+        try:
+            import pygame as pygame_module
+        except ImportError as e:
+            raise BackendUnavailable(f"pygame could not be loaded: {e}") from e
+        pygame = pygame_module
+    return pygame
+
+class LocalAudioPlayer(AudioBackend):
+    def __init__(self, buffer_samples=None):
+        """
+        Args:
+            buffer_samples: Mixer buffer size in samples (power of two).
+                Smaller buffers start playback sooner but risk underruns
+                (crackling) on a busy Pi. Defaults to MUSICPLAYER_MIXER_BUFFER
+                or 1024 (~23 ms at 44.1 kHz); doubled up to 4096 if SDL
+                rejects it.
+        """
+        _load_pygame()
 
-class LocalAudioPlayer:
-    def __init__(self):
         # Force pygame to use ALSA
         os.environ['SDL_AUDIODRIVER'] = 'alsa'
         os.environ['AUDIODEV'] = 'default'
-        
-        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=2048)
+
+        if buffer_samples is None:
+            buffer_samples = int(os.getenv('MUSICPLAYER_MIXER_BUFFER', '1024'))
+
+        while True:
+            try:
+                pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=buffer_samples)
+                break
+            except pygame.error:
+                if buffer_samples >= 4096:
+                    raise
+                buffer_samples *= 2
+        self.buffer_samples = buffer_samples
         
         self.current_song = None
         self.is_playing = False
@@ -44,12 +81,6 @@ class LocalAudioPlayer:
             pygame.mixer.music.unpause()
             self.is_paused = False
     
-    def toggle_pause(self):
-        if self.is_paused:
-            self.unpause()
-        else:
-            self.pause()
-    
     def stop(self):
         pygame.mixer.music.stop()
         self.is_playing = False
@@ -59,11 +90,15 @@ class LocalAudioPlayer:
         self.volume = max(0.0, min(1.0, volume))
         pygame.mixer.music.set_volume(self.volume)
     
-    def volume_up(self, step=0.1):
-        self.set_volume(self.volume + step)
+    def get_volume(self):
+        return self.volume
     
-    def volume_down(self, step=0.1):
-        self.set_volume(self.volume - step)
+    def get_position(self):
+        if not self.is_playing:
+            return 0
+        # get_pos() is milliseconds since play() started, -1 when stopped
+        pos = pygame.mixer.music.get_pos()
+        return pos / 1000.0 if pos >= 0 else 0
     
-    def get_volume(self):
-        return self.volume
\ No newline at end of file
+    def is_finished(self):
+        return self.is_playing and not self.is_paused and not pygame.mixer.music.get_busy()
\ No newline at end of file
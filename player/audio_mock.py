@@ -1,4 +1,7 @@
-class AudioPlayer:
+from player.audio_base import AudioBackend
+
+
+class AudioPlayer(AudioBackend):
     """Mock audio player for testing without sound"""
     def __init__(self):
         self.current_song = None
@@ -6,7 +9,8 @@ class AudioPlayer:
         self.is_paused = False
         self.volume = 0.7
         
-    def play(self, stream_url, song_info):
+    def play(self, stream_url, song_info=None):
+        song_info = song_info or {}
         print(f"Mock: Playing {song_info.get('title', 'Unknown')}")
         self.current_song = song_info
         self.is_playing = True
@@ -23,12 +27,6 @@ class AudioPlayer:
             print("Mock: Unpaused")
             self.is_paused = False
     
-    def toggle_pause(self):
-        if self.is_paused:
-            self.unpause()
-        else:
-            self.pause()
-    
     def stop(self):
         print("Mock: Stopped")
         self.is_playing = False
@@ -38,12 +36,6 @@ class AudioPlayer:
         self.volume = max(0.0, min(1.0, volume))
         print(f"Mock: Volume set to {int(self.volume * 100)}%")
     
-    def volume_up(self, step=0.1):
-        self.set_volume(self.volume + step)
-    
-    def volume_down(self, step=0.1):
-        self.set_volume(self.volume - step)
-    
     def get_position(self):
         return 0
     
@@ -1,13 +1,51 @@
 """Bluetooth audio management for Raspberry Pi"""
-import subprocess
+import atexit
+import os
 import re
+import select
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from utils.logger import get_logger
+try:
+    from pydbus import SystemBus
+    PYDBUS_AVAILABLE = True
+except ImportError:
+    PYDBUS_AVAILABLE = False
+
+# bluetoothctl colours its output and wraps the prompt in readline markers
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*[A-Za-z]|[\x01\x02]')
+# Interactive prompt, e.g. "[bluetooth]# " or "[My Headphones]# "
+_PROMPT_RE = re.compile(r'\[[^\]\n]*\][#>]\s*$')
+
+_POWER_DONE_RE = re.compile(r'succeeded|Failed|No default controller|not available')
+_PAIR_DONE_RE = re.compile(r'Pairing successful|already paired|Failed to pair|not available')
+_CONNECT_DONE_RE = re.compile(r'Connection successful|already connected|Failed to connect|not available')
+
+# "Device XX:XX:XX:XX:XX:XX Device Name" lines from "devices"
+_DEVICE_RE = re.compile(r'Device\s+([0-9A-F:]+)\s+(.+)', re.IGNORECASE)
+_CONNECTED_RE = re.compile(r'^\s*Connected:\s*yes', re.M)
+
+
+logger = get_logger("hardware")
 
 
 class BluetoothManager:
-    """Manage Bluetooth audio connections on Raspberry Pi"""
+    """Manage Bluetooth audio connections on Raspberry Pi
+
+    Commands go through one long-lived interactive bluetoothctl process
+    shared by all instances, instead of forking bluetoothctl per query.
+    If the session cannot be started, each command falls back to a
+    one-shot bluetoothctl call.
+    """
+
+    _repl = None
+    _repl_lock = threading.Lock()
 
     def __init__(self):
         self.bluetoothctl_available = self._check_bluetoothctl()
+        self._scan_procs = []
 
     def _check_bluetoothctl(self):
         """Check if bluetoothctl is available"""
@@ -33,6 +71,125 @@ class BluetoothManager:
         except Exception as e:
             return f"Error: {e}"
 
+    @classmethod
+    def _get_repl(cls):
+        """Return the shared bluetoothctl session, starting it if needed"""
+        if cls._repl is not None:
+            if cls._repl.poll() is None:
+                return cls._repl
+            cls._terminate(cls._repl)  # Exited on its own - close its pipes
+
+        try:
+            cls._repl = subprocess.Popen(['bluetoothctl'],
+                                         stdin=subprocess.PIPE,
+                                         stdout=subprocess.PIPE,
+                                         stderr=subprocess.STDOUT)
+        except OSError:
+            cls._repl = None
+            return None
+
+        # Swallow the startup banner and first prompt
+        cls._read_output(cls._repl, timeout=1)
+        return cls._repl
+
+    @classmethod
+    def close(cls):
+        """Terminate the shared bluetoothctl session"""
+        with cls._repl_lock:
+            proc, cls._repl = cls._repl, None
+            if proc is None:
+                return
+            if proc.poll() is None:
+                try:
+                    proc.stdin.write(b'quit\n')
+                    proc.stdin.flush()
+                    proc.wait(timeout=1)
+                except (OSError, subprocess.TimeoutExpired):
+                    pass
+            cls._terminate(proc)
+
+    @staticmethod
+    def _terminate(proc):
+        """Stop and reap a bluetoothctl session and close its pipes"""
+        if proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+        for pipe in (proc.stdin, proc.stdout):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
+    @classmethod
+    def _has_repl(cls):
+        """Check (under the lock) that the shared session is or can be started"""
+        with cls._repl_lock:
+            return cls._get_repl() is not None
+
+    @staticmethod
+    def _read_output(proc, timeout, expect=None):
+        """Read session output until expect (default: a new prompt) appears or timeout"""
+        fd = proc.stdout.fileno()
+        pattern = expect or _PROMPT_RE
+        deadline = time.monotonic() + timeout
+        output = ""
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                break
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                break  # Session exited
+            output += _ANSI_RE.sub('', chunk.decode(errors='replace'))
+            if pattern.search(output):
+                break
+
+        return output
+
+    @staticmethod
+    def _drain(proc):
+        """Discard unsolicited output ([CHG]/[NEW] events) left from earlier commands"""
+        fd = proc.stdout.fileno()
+        while select.select([fd], [], [], 0)[0]:
+            if not os.read(fd, 4096):
+                break
+
+    def _cmd(self, command, timeout=2, expect=None):
+        """Run a command in the shared bluetoothctl session
+
+        Args:
+            command: bluetoothctl command line (e.g. "info XX:XX:...")
+            timeout: Seconds to wait for the command to finish
+            expect: Optional compiled regex that marks the end of the output,
+                    for commands that report their result asynchronously
+
+        Returns:
+            Command output with colour codes stripped
+        """
+        with self._repl_lock:
+            proc = self._get_repl()
+            if proc is not None:
+                try:
+                    self._drain(proc)
+                    proc.stdin.write(f"{command}\n".encode())
+                    proc.stdin.flush()
+                    return self._read_output(proc, timeout, expect)
+                except OSError:
+                    # Broken session - reap it so the next command starts fresh
+                    BluetoothManager._repl = None
+                    self._terminate(proc)
+
+        # No interactive session - fall back to a one-shot call
+        return self._run_bluetoothctl(command, timeout)
+
     def scan_devices(self, duration=10):
         """Scan for nearby Bluetooth devices
 
@@ -46,158 +203,278 @@ class BluetoothManager:
         seen_macs = set()
 
         try:
-            import time
+            if self._has_repl():
+                # Whole scan runs inside the shared session - no extra processes
+                self._cmd('power on', timeout=2, expect=_POWER_DONE_RE)
+                self._cmd('scan on')
 
-            # Make sure Bluetooth is powered on
-            subprocess.run(['bluetoothctl', 'power', 'on'],
-                         capture_output=True,
-                         timeout=2)
-            time.sleep(1)
+                print(f"Scanning for Bluetooth devices ({duration} seconds)...")
+                print("Put your headphones in pairing mode (hold power ~7 seconds)")
+                time.sleep(duration)
+
+                self._cmd('scan off')
+                output = self._cmd('devices')
+            else:
+                output = self._scan_oneshot(duration)
+
+            print(f"Raw devices output:\n{output}")
+
+            # One query for the paired set instead of an "info" call per device
+            paired_macs = self._paired_macs()
+
+            for mac, name in self._parse_devices(output):
+                # Skip LE_ prefixed devices - they're low energy only
+                # We want the classic Bluetooth version for audio
+                if name.startswith('LE_'):
+                    continue
+
+                if name and mac not in seen_macs:
+                    seen_macs.add(mac)
+                    paired = mac in paired_macs
+                    devices.append((mac, name, paired))
+                    print(f"Found device: {name} ({mac}) - Paired: {paired}")
+
+        except Exception as e:
+            print(f"Error scanning for devices: {e}")
+
+        return devices
+
+    def iter_scan_devices(self, duration=10):
+        """Scan for nearby Bluetooth devices, yielding each one as it is found
+
+        Uses BlueZ over D-Bus when pydbus is installed, so callers can show
+        results as they arrive or stop early; otherwise falls back to
+        scan_devices().
+
+        Yields:
+            Tuples (mac_address, device_name, paired_status)
+        """
+        if PYDBUS_AVAILABLE:
+            try:
+                bus = SystemBus()
+                manager = bus.get('org.bluez', '/')
+                adapter = bus.get('org.bluez', '/org/bluez/hci0')
+            except Exception as e:
+                logger.warning("D-Bus scan unavailable, using bluetoothctl: %s", e)
+            else:
+                if (yield from self._iter_dbus_devices(manager, adapter, duration)):
+                    return
 
-            # Start BR/EDR (classic Bluetooth) scan
+        if not self.bluetoothctl_available:
+            return
+        yield from self.scan_devices(duration)
+
+    def _iter_dbus_devices(self, manager, adapter, duration):
+        """Yield devices from BlueZ's object tree while discovery runs
+
+        Returns False (nothing yielded) if discovery couldn't be started,
+        so the caller can fall back to bluetoothctl; D-Bus errors mid-scan
+        (adapter gone, rfkill) end the scan with what was found so far.
+        """
+        seen_macs = set()
+        try:
+            adapter.Powered = True
+            adapter.StartDiscovery()
+        except Exception as e:  # e.g. org.bluez.Error.InProgress / NotReady
+            logger.warning("D-Bus discovery failed to start, using bluetoothctl: %s", e)
+            return False
+        try:
+            deadline = time.monotonic() + duration
+            while True:
+                try:
+                    objects = manager.GetManagedObjects()
+                except Exception as e:
+                    logger.warning("D-Bus scan stopped: %s", e)
+                    break
+                for props in objects.values():
+                    device = props.get('org.bluez.Device1')
+                    if not device:
+                        continue
+                    mac = device.get('Address', '').upper()
+                    name = device.get('Name') or device.get('Alias', '')
+                    # Skip LE_ prefixed devices - we want the classic version for audio
+                    if not name or name.startswith('LE_') or mac in seen_macs:
+                        continue
+                    seen_macs.add(mac)
+                    yield (mac, name, bool(device.get('Paired', False)))
+
+                if time.monotonic() >= deadline:
+                    break
+                time.sleep(0.5)
+        finally:
+            try:
+                adapter.StopDiscovery()
+            except Exception:
+                pass
+        return True
+
+    def _scan_oneshot(self, duration):
+        """Scan using separate bluetoothctl processes (no interactive session)
+
+        Returns:
+            Raw output of "bluetoothctl devices"
+        """
+        # Make sure Bluetooth is powered on
+        subprocess.run(['bluetoothctl', 'power', 'on'],
+                     capture_output=True,
+                     timeout=2)
+        time.sleep(1)
+
+        # Start BR/EDR (classic Bluetooth) scan, plus Bluetooth LE (low
+        # energy) devices. Keep the handles so the children get reaped.
+        self._scan_procs = [
             subprocess.Popen(['bluetoothctl', 'scan', 'on'],
                            stdout=subprocess.DEVNULL,
-                           stderr=subprocess.DEVNULL)
-
-            # Also scan for Bluetooth LE (low energy) devices
+                           stderr=subprocess.DEVNULL),
             subprocess.Popen(['bluetoothctl', 'scan', 'le'],
                            stdout=subprocess.DEVNULL,
-                           stderr=subprocess.DEVNULL)
+                           stderr=subprocess.DEVNULL),
+        ]
 
+        try:
             print(f"Scanning for Bluetooth devices ({duration} seconds)...")
             print("Put your headphones in pairing mode (hold power ~7 seconds)")
             time.sleep(duration)
+        finally:
+            for proc in self._scan_procs:
+                proc.terminate()
+                try:
+                    proc.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+            self._scan_procs = []
+
+        # Stop both scans
+        subprocess.run(['bluetoothctl', 'scan', 'off'],
+                     capture_output=True,
+                     timeout=2)
+
+        # Get list of all known devices
+        result = subprocess.run(['bluetoothctl', 'devices'],
+                              capture_output=True,
+                              text=True,
+                              timeout=2)
+        return result.stdout
+
+    @staticmethod
+    def _parse_devices(output):
+        """Parse "Device XX:XX:XX:XX:XX:XX Device Name" lines
 
-            # Stop both scans
-            subprocess.run(['bluetoothctl', 'scan', 'off'],
-                         capture_output=True,
-                         timeout=2)
-
-            # Get list of all known devices
-            result = subprocess.run(['bluetoothctl', 'devices'],
-                                  capture_output=True,
-                                  text=True,
-                                  timeout=2)
-
-            print(f"Raw devices output:\n{result.stdout}")
-
-            # Parse devices
-            # Format: "Device XX:XX:XX:XX:XX:XX Device Name"
-            for line in result.stdout.split('\n'):
-                # Try case-insensitive match for MAC addresses
-                match = re.match(r'Device\s+([0-9A-Fa-f:]+)\s+(.+)', line, re.IGNORECASE)
-                if match:
-                    mac = match.group(1).upper()
-                    name = match.group(2).strip()
-
-                    # Skip LE_ prefixed devices - they're low energy only
-                    # We want the classic Bluetooth version for audio
-                    if name.startswith('LE_'):
-                        continue
-
-                    if name and mac not in seen_macs:
-                        seen_macs.add(mac)
-                        paired = self.is_paired(mac)
-                        devices.append((mac, name, paired))
-                        print(f"Found device: {name} ({mac}) - Paired: {paired}")
+        Returns:
+            List of tuples (mac_address, device_name), MACs upper-cased
+        """
+        devices = []
+        for line in output.split('\n'):
+            match = _DEVICE_RE.match(line)
+            if match:
+                devices.append((match.group(1).upper(), match.group(2).strip()))
+        return devices
 
-        except Exception as e:
-            print(f"Error scanning for devices: {e}")
+    def _filtered_devices(self, state):
+        """List devices in a given state ("Paired" or "Connected") with one query
 
-        return devices
+        Returns:
+            List of tuples (mac_address, device_name)
+        """
+        output = self._cmd(f'devices {state}')
+        if 'Invalid' in output or 'Too many' in output:
+            # bluetoothctl < 5.65 does not accept a filter argument
+            if state == 'Paired':
+                output = self._cmd('paired-devices')
+            else:
+                return [(mac, name) for mac, name in self._parse_devices(self._cmd('devices'))
+                        if _CONNECTED_RE.search(self._cmd(f'info {mac}'))]
+        return self._parse_devices(output)
+
+    def _paired_macs(self):
+        """Get the set of paired device MACs"""
+        try:
+            return {mac for mac, _ in self._filtered_devices('Paired')}
+        except Exception:
+            return set()
 
     def is_paired(self, mac_address):
         """Check if device is paired"""
-        try:
-            result = subprocess.run(
-                ['bluetoothctl', 'info', mac_address],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-            return 'Paired: yes' in result.stdout
-        except:
-            return False
+        return mac_address.upper() in self._paired_macs()
 
     def is_connected(self, mac_address):
         """Check if device is connected"""
         try:
-            result = subprocess.run(
-                ['bluetoothctl', 'info', mac_address],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-            return 'Connected: yes' in result.stdout
-        except:
+            return _CONNECTED_RE.search(self._cmd(f'info {mac_address}')) is not None
+        except Exception:
             return False
 
     def pair_device(self, mac_address):
         """Pair with a device"""
         try:
-            result = subprocess.run(
-                ['bluetoothctl', 'pair', mac_address],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            return 'Pairing successful' in result.stdout or 'already paired' in result.stdout
+            output = self._cmd(f'pair {mac_address}', timeout=30, expect=_PAIR_DONE_RE)
+            return 'Pairing successful' in output or 'already paired' in output
         except Exception as e:
             return False
 
     def trust_device(self, mac_address):
         """Trust a device (auto-connect)"""
         try:
-            subprocess.run(
-                ['bluetoothctl', 'trust', mac_address],
-                capture_output=True,
-                timeout=5
-            )
+            self._cmd(f'trust {mac_address}', timeout=5)
             return True
-        except:
+        except Exception:
             return False
 
     def connect_device(self, mac_address):
         """Connect to a paired device"""
         try:
-            result = subprocess.run(
-                ['bluetoothctl', 'connect', mac_address],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            success = 'Connection successful' in result.stdout or 'already connected' in result.stdout
+            output = self._cmd(f'connect {mac_address}', timeout=30, expect=_CONNECT_DONE_RE)
+            success = 'Connection successful' in output or 'already connected' in output
 
             if success:
-                # Trust device for auto-reconnect
-                self.trust_device(mac_address)
+                # Trust device for auto-reconnect (in the background - the
+                # caller doesn't need to wait for it)
+                threading.Thread(target=self.trust_device, args=(mac_address,),
+                                 daemon=True).start()
 
             return success
         except Exception as e:
             return False
 
+    def reconnect_known(self):
+        """Try to reconnect all paired devices in parallel
+
+        Each connect runs as its own one-shot bluetoothctl call, since the
+        shared session handles one command at a time.
+
+        Returns:
+            List of MAC addresses that connected
+        """
+        if not self.bluetoothctl_available:
+            return []
+
+        paired = self._paired_macs()
+        if not paired:
+            return []
+
+        def connect(mac):
+            output = self._run_bluetoothctl(f'connect {mac}', timeout=15)
+            return 'Connection successful' in output or 'already connected' in output
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(connect, paired))
+        return [mac for mac, ok in zip(paired, results) if ok]
+
     def disconnect_device(self, mac_address):
         """Disconnect from a device"""
         try:
-            subprocess.run(
-                ['bluetoothctl', 'disconnect', mac_address],
-                capture_output=True,
-                timeout=5
-            )
+            self._cmd(f'disconnect {mac_address}', timeout=5)
             return True
-        except:
+        except Exception:
             return False
 
     def remove_device(self, mac_address):
         """Remove/unpair a device"""
         try:
-            subprocess.run(
-                ['bluetoothctl', 'remove', mac_address],
-                capture_output=True,
-                timeout=5
-            )
+            self._cmd(f'remove {mac_address}', timeout=5)
             return True
-        except:
+        except Exception:
             return False
 
     def get_connected_devices(self):
@@ -206,27 +483,10 @@ class BluetoothManager:
         Returns:
             List of tuples (mac_address, device_name)
         """
-        devices = []
         try:
-            result = subprocess.run(
-                ['bluetoothctl', 'devices'],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-
-            for line in result.stdout.split('\n'):
-                match = re.match(r'Device\s+([0-9A-F:]+)\s+(.+)', line)
-                if match:
-                    mac = match.group(1)
-                    name = match.group(2)
-                    if self.is_connected(mac):
-                        devices.append((mac, name))
-
-        except:
-            pass
-
-        return devices
+            return self._filtered_devices('Connected')
+        except Exception:
+            return []
 
     def set_as_default_sink(self):
         """Set Bluetooth as default audio sink and move active streams to it."""
@@ -266,3 +526,5 @@ class BluetoothManager:
         except Exception:
             return False
 
+
+atexit.register(BluetoothManager.close)
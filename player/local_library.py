@@ -3,64 +3,253 @@ Local Music Library Scanner
 Scans a directory for music files and extracts metadata
 """
 
+import importlib.util
+import json
 import os
+import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-try:
-    from mutagen.mp3 import MP3
-    from mutagen.flac import FLAC
-    from mutagen.mp4 import MP4
-    from mutagen.oggvorbis import OggVorbis
-    MUTAGEN_AVAILABLE = True
-except ImportError:
-    MUTAGEN_AVAILABLE = False
+from utils.logger import get_logger
+
+# mutagen is only imported when a scan actually runs, so Navidrome-only
+# use doesn't pay for loading it
+MUTAGEN_AVAILABLE = importlib.util.find_spec('mutagen') is not None
+MutagenFile = None
+if not MUTAGEN_AVAILABLE:
     print("mutagen not available - install with: pip install mutagen")
 
+logger = get_logger("main")
+
+
+def _load_mutagen():
+    """Import mutagen.File on first use"""
+    global MutagenFile
+    if MutagenFile is None and MUTAGEN_AVAILABLE:
+        from mutagen import File
+        MutagenFile = File
+
+
+# Leading digits of a track tag such as "3", "03/12" or "3 of 12"
+_TRACK_RE = re.compile(r'\s*(\d+)')
+
+
+def _coerce_track(value):
+    """Convert a track number tag to an int (0 if missing or unparseable)"""
+    match = _TRACK_RE.match(str(value)) if value else None
+    return int(match.group(1)) if match else 0
+
 
 class LocalLibrary:
     """Manages local music files"""
     
     SUPPORTED_FORMATS = {'.mp3', '.flac', '.m4a', '.ogg', '.opus', '.wav'}
+    # Extensions without the dot, for a single hash lookup per file name
+    EXTENSIONS = frozenset(ext.lstrip('.') for ext in SUPPORTED_FORMATS)
+    # Directories never worth descending into (hidden dirs are skipped too)
+    SKIP_DIRS = frozenset({'node_modules', '__pycache__', '$Recycle.Bin'})
+    # Bump when tag parsing changes so cached entries are re-read
+    CACHE_VERSION = 2
     
-    def __init__(self, music_dir="/home/jack/"):
+    def __init__(self, music_dir="/home/jack/", cache_path=None):
         """
         Initialize local library scanner
         
         Args:
             music_dir: Path to music directory
+            cache_path: SQLite file caching tags by (path, mtime, size);
+                        defaults to ~/.cache/musicplayer/scan.db
         """
         self.music_dir = Path(music_dir)
+        self.cache_path = Path(cache_path) if cache_path else Path.home() / ".cache" / "musicplayer" / "scan.db"
         self.songs = []
         self.albums = {}
         self.artists = {}
+        # Sorted listings, built on first request after each scan
+        self._album_list = None
+        self._artist_list = None
     
     def scan(self):
         """Scan music directory for files"""
         print(f"Scanning {self.music_dir}...")
-        self.songs = []
+        self.songs = list(self._iter_files())
+
+        print(f"Found {len(self.songs)} songs")
         
+        # Organize by album and artist
+        self._organize()
+
+    def scan_iter(self):
+        """Scan music directory, yielding each song as soon as it is read
+
+        Albums and artists are updated as songs arrive, so a UI can show
+        (and browse) the partial library while the scan is still running.
+        """
+        print(f"Scanning {self.music_dir}...")
+        self.songs = []
+        self.albums = {}
+        self.artists = {}
+
+        for song in self._iter_files():
+            self.songs.append(song)
+            self._add_song(song)
+            yield song
+
+        # Sort songs within albums by track number
+        for album in self.albums.values():
+            album['songs'].sort(key=lambda s: s['track'])
+        self._album_list = None
+        self._artist_list = None
+        print(f"Found {len(self.songs)} songs")
+
+    def _iter_files(self):
+        """Walk the music directory and yield song info for each music file"""
         if not self.music_dir.exists():
             print(f"Music directory not found: {self.music_dir}")
             return
         
-        # Find all music files
-        for ext in self.SUPPORTED_FORMATS:
-            for filepath in self.music_dir.rglob(f"*{ext}"):
-                song_info = self._get_file_info(filepath)
+        _load_mutagen()
+
+        # Find all music files in a single pass over the tree
+        files_found = []
+        extensions = self.EXTENSIONS
+        skip_dirs = self.SKIP_DIRS
+        for root, dirs, files in os.walk(self.music_dir, followlinks=False):
+            # Prune in place so os.walk never descends into .git, .Trash, etc.
+            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in skip_dirs]
+            for name in files:
+                i = name.rfind('.')
+                if i > 0 and name[i + 1:].lower() in extensions:
+                    files_found.append((os.path.join(root, name), name, name[:i], name[i:].lower()))
+
+        # Unchanged files are served from the scan cache without touching mutagen
+        cache = self._open_cache()
+        cached = self._load_cache(cache)
+        moved = self._index_moved(cached, files_found)
+
+        # Tag reading is disk-bound, so overlap it across a thread pool.
+        # map() hands results back in order as they complete.
+        workers = int(os.environ.get("MUSICPLAYER_SCAN_PARALLELISM", (os.cpu_count() or 1) + 1))
+        executor = ThreadPoolExecutor(max_workers=max(1, workers))
+        fresh_rows = []
+        try:
+            for song_info, row in executor.map(
+                    lambda args: self._get_cached_file_info(cached, moved, *args), files_found):
+                if row:
+                    fresh_rows.append(row)
                 if song_info:
-                    self.songs.append(song_info)
-        
-        print(f"Found {len(self.songs)} songs")
-        
-        # Organize by album and artist
-        self._organize()
-    
-    def _get_file_info(self, filepath):
-        """Extract metadata from music file"""
+                    yield song_info
+        finally:
+            # Caller may stop early - don't wait for the remaining files
+            executor.shutdown(wait=False, cancel_futures=True)
+            present = {args[0] for args in files_found}
+            self._save_cache(cache, fresh_rows, cached, present)
+
+    def _open_cache(self):
+        """Open the scan cache database (None if it can't be used)"""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache = sqlite3.connect(str(self.cache_path))
+            cache.execute("CREATE TABLE IF NOT EXISTS files "
+                          "(path TEXT PRIMARY KEY, mtime REAL, size INTEGER, info TEXT)")
+            if cache.execute("PRAGMA user_version").fetchone()[0] != self.CACHE_VERSION:
+                with cache:
+                    cache.execute("DELETE FROM files")
+                    cache.execute(f"PRAGMA user_version = {self.CACHE_VERSION}")
+            return cache
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Scan cache unavailable (%s): %s", self.cache_path, e)
+            return None
+
+    def _load_cache(self, cache):
+        """Read the whole cache into a dict: path -> (mtime, size, info json)"""
+        if cache is None:
+            return {}
+        try:
+            return {path: (mtime, size, info)
+                    for path, mtime, size, info in cache.execute("SELECT path, mtime, size, info FROM files")}
+        except sqlite3.Error as e:
+            logger.warning("Could not read scan cache: %s", e)
+            return {}
+
+    def _save_cache(self, cache, fresh_rows, cached, present):
+        """Store newly parsed files and drop entries for files that are gone"""
+        if cache is None:
+            return
+        try:
+            with cache:
+                cache.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", fresh_rows)
+                cache.executemany("DELETE FROM files WHERE path = ?",
+                                  [(path,) for path in cached if path not in present])
+        except sqlite3.Error as e:
+            logger.warning("Could not write scan cache: %s", e)
+        finally:
+            cache.close()
+
+    @staticmethod
+    def _index_moved(cached, files_found):
+        """Index cached entries whose file is gone by (mtime, size)
+
+        A new path with the same (mtime, size) as a vanished one is almost
+        certainly that file renamed/moved, so its tags can be reused.
+        Keys shared by several vanished files are dropped as ambiguous.
+        """
+        present = {args[0] for args in files_found}
+        moved = {}
+        for path, (mtime, size, info) in cached.items():
+            if path in present:
+                continue
+            key = (mtime, size)
+            moved[key] = None if key in moved else (path, info)
+        return {key: entry for key, entry in moved.items() if entry}
+
+    def _get_cached_file_info(self, cached, moved, filepath, name, stem, ext):
+        """Get metadata from the scan cache, or parse the file if it changed
+
+        Returns:
+            (song_info, cache_row) - cache_row is None when the cache was hit
+        """
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return None, None
+
+        entry = cached.get(filepath)
+        if entry and entry[0] == st.st_mtime and entry[1] == st.st_size:
+            return json.loads(entry[2]), None
+
+        if not entry and (st.st_mtime, st.st_size) in moved:
+            # Renamed/moved file - reuse its tags, just update the location
+            old_path, info = moved[(st.st_mtime, st.st_size)]
+            song_info = json.loads(info)
+            if song_info['title'] == os.path.splitext(os.path.basename(old_path))[0]:
+                song_info['title'] = stem  # Title came from the old filename
+            song_info['path'] = filepath
+            song_info['filename'] = name
+            return song_info, (filepath, st.st_mtime, st.st_size, json.dumps(song_info))
+
+        song_info = self._get_file_info(filepath, name, stem, ext)
+        if not song_info or not MUTAGEN_AVAILABLE:
+            # Don't cache filename-only placeholders - retry once tags can be read
+            return song_info, None
+        return song_info, (filepath, st.st_mtime, st.st_size, json.dumps(song_info))
+
+    def _get_file_info(self, filepath, name, stem, ext):
+        """Extract metadata from music file
+
+        Args:
+            filepath: Full path to the file (str)
+            name: File name
+            stem: File name without extension
+            ext: Lower-cased extension, including the dot
+        """
         try:
             song_info = {
-                'path': str(filepath),
-                'filename': filepath.name,
-                'title': filepath.stem,  # Default to filename
+                'path': filepath,
+                'filename': name,
+                'title': stem,  # Default to filename
                 'artist': 'Unknown Artist',
                 'album': 'Unknown Album',
                 'track': 0,
@@ -70,95 +259,86 @@ class LocalLibrary:
             if not MUTAGEN_AVAILABLE:
                 return song_info
             
-            # Try to read tags
-            audio = None
-            ext = filepath.suffix.lower()
-            
-            if ext == '.mp3':
-                audio = MP3(filepath)
-                if audio.tags:
-                    song_info['title'] = str(audio.tags.get('TIT2', [filepath.stem])[0])
-                    song_info['artist'] = str(audio.tags.get('TPE1', ['Unknown Artist'])[0])
-                    song_info['album'] = str(audio.tags.get('TALB', ['Unknown Album'])[0])
-                    track = audio.tags.get('TRCK', ['0'])[0]
-                    song_info['track'] = int(str(track).split('/')[0]) if track else 0
-            
-            elif ext == '.flac':
-                audio = FLAC(filepath)
-                song_info['title'] = audio.get('title', [filepath.stem])[0]
-                song_info['artist'] = audio.get('artist', ['Unknown Artist'])[0]
-                song_info['album'] = audio.get('album', ['Unknown Album'])[0]
-                track = audio.get('tracknumber', ['0'])[0]
-                song_info['track'] = int(str(track).split('/')[0]) if track else 0
-            
-            elif ext == '.m4a':
-                audio = MP4(filepath)
-                song_info['title'] = audio.tags.get('\xa9nam', [filepath.stem])[0]
-                song_info['artist'] = audio.tags.get('\xa9ART', ['Unknown Artist'])[0]
-                song_info['album'] = audio.tags.get('\xa9alb', ['Unknown Album'])[0]
-                track = audio.tags.get('trkn', [(0,)])[0]
-                song_info['track'] = track[0] if track else 0
-            
-            elif ext in ['.ogg', '.opus']:
-                audio = OggVorbis(filepath)
-                song_info['title'] = audio.get('title', [filepath.stem])[0]
-                song_info['artist'] = audio.get('artist', ['Unknown Artist'])[0]
-                song_info['album'] = audio.get('album', ['Unknown Album'])[0]
-                track = audio.get('tracknumber', ['0'])[0]
-                song_info['track'] = int(str(track).split('/')[0]) if track else 0
-            
-            if audio:
-                song_info['duration'] = int(audio.info.length)
+            # Try to read tags - mutagen picks the right parser for the
+            # format, and easy=True gives every format the same tag keys
+            audio = MutagenFile(filepath, easy=True)
+            if audio is None:
+                return song_info
+
+            tags = audio.tags or {}
+            song_info['title'] = (tags.get('title') or [stem])[0]
+            song_info['artist'] = (tags.get('artist') or ['Unknown Artist'])[0]
+            song_info['album'] = (tags.get('album') or ['Unknown Album'])[0]
+            song_info['track'] = _coerce_track((tags.get('tracknumber') or [None])[0])
+            song_info['duration'] = int(audio.info.length)
             
             return song_info
             
         except Exception as e:
-            print(f"Error reading {filepath}: {e}")
+            # Runs on scan worker threads - logging is thread-safe, print isn't
+            logger.warning("Error reading %s: %s", filepath, e)
             return None
     
+    def _add_song(self, song):
+        """Add one song to the album/artist groupings (incremental scans)"""
+        album_name = song['album']
+        artist_name = song['artist']
+
+        album = self.albums.get(album_name)
+        if album is None:
+            album = self.albums[album_name] = {'name': album_name, 'artist': artist_name, 'songs': []}
+        album['songs'].append(song)
+
+        artist = self.artists.get(artist_name)
+        if artist is None:
+            artist = self.artists[artist_name] = {'name': artist_name, 'albums': [], 'songs': []}
+        if album_name not in artist['albums']:
+            artist['albums'].append(album_name)
+        artist['songs'].append(song)
+
+        # Listings are rebuilt on next request
+        self._album_list = None
+        self._artist_list = None
+
     def _organize(self):
         """Organize songs by album and artist"""
+        self._album_list = None
+        self._artist_list = None
+
+        # One sort puts each album's songs together and in track order,
+        # so groupby can emit the groups without per-song dict lookups
+        self.songs.sort(key=itemgetter('album', 'track'))
         self.albums = {}
+        for album_name, group in groupby(self.songs, key=itemgetter('album')):
+            songs = list(group)
+            self.albums[album_name] = {'name': album_name, 'artist': songs[0]['artist'], 'songs': songs}
+
+        # Stable sort by artist keeps album/track order within each artist
+        by_artist = sorted(self.songs, key=itemgetter('artist'))
         self.artists = {}
-        
-        for song in self.songs:
-            # Group by album
-            album_name = song['album']
-            if album_name not in self.albums:
-                self.albums[album_name] = {
-                    'name': album_name,
-                    'artist': song['artist'],
-                    'songs': []
-                }
-            self.albums[album_name]['songs'].append(song)
-            
-            # Group by artist
-            artist_name = song['artist']
-            if artist_name not in self.artists:
-                self.artists[artist_name] = {
-                    'name': artist_name,
-                    'albums': set(),
-                    'songs': []
-                }
-            self.artists[artist_name]['albums'].add(album_name)
-            self.artists[artist_name]['songs'].append(song)
-        
-        # Sort songs within albums by track number
-        for album in self.albums.values():
-            album['songs'].sort(key=lambda s: s['track'])
+        for artist_name, group in groupby(by_artist, key=itemgetter('artist')):
+            songs = list(group)
+            self.artists[artist_name] = {
+                'name': artist_name,
+                'albums': list(dict.fromkeys(song['album'] for song in songs)),  # Dedupe, keep order
+                'songs': songs
+            }
     
     def get_albums(self):
-        """Get list of albums sorted by name"""
-        albums = [
-            {
-                'id': name,
-                'name': name,
-                'artist': info['artist'],
-                'song_count': len(info['songs'])
-            }
-            for name, info in self.albums.items()
-        ]
-        return sorted(albums, key=lambda a: a['name'])
+        """Get list of albums sorted by name (case-insensitive)"""
+        if self._album_list is None:
+            # Casefold each name once instead of on every comparison
+            keyed = sorted((name.casefold(), name, info) for name, info in self.albums.items())
+            self._album_list = [
+                {
+                    'id': name,
+                    'name': name,
+                    'artist': info['artist'],
+                    'song_count': len(info['songs'])
+                }
+                for _, name, info in keyed
+            ]
+        return list(self._album_list)
     
     def get_album_songs(self, album_id):
         """Get songs in an album"""
@@ -167,18 +347,19 @@ class LocalLibrary:
         return []
     
     def get_artists(self):
-        """Get list of artists"""
-        artists = [
-            {
-                'id': name,
-                'name': name,
-                'album_count': len(info['albums']),
-                'song_count': len(info['songs'])
-            }
-            for name, info in self.artists.items()
-        ]
-        return sorted(artists, key=lambda a: a['name'])
-
+        """Get list of artists sorted by name (case-insensitive)"""
+        if self._artist_list is None:
+            keyed = sorted((name.casefold(), name, info) for name, info in self.artists.items())
+            self._artist_list = [
+                {
+                    'id': name,
+                    'name': name,
+                    'album_count': len(info['albums']),
+                    'song_count': len(info['songs'])
+                }
+                for _, name, info in keyed
+            ]
+        return list(self._artist_list)
 
 if __name__ == "__main__":
     # Test the library scanner
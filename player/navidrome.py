@@ -1,9 +1,18 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
-import random
-import string
+import secrets
+import time
+from urllib.parse import urlencode
 import config
 from utils.logger import get_logger
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = get_logger("network")
 
@@ -14,15 +23,60 @@ class NavidromeClient:
         self.password = config.NAVIDROME_PASS
         self.api_version = '1.16.1'
         self.client_name = 'MusicPlayer'
+
+        # Query-string part that is the same for every stream/cover URL
+        self._static_qs = urlencode({'u': self.username, 'v': self.api_version,
+                                     'c': self.client_name})
+        self._stream_prefix = f"{self.base_url}/rest/stream?{self._static_qs}&format=mp3&maxBitRate=320"
+        self._cover_prefix = f"{self.base_url}/rest/getCoverArt?{self._static_qs}"
+
+        # Subsonic lets a (token, salt) pair be reused, so only re-hash periodically
+        self._auth = None
+        self._auth_ts = 0
+
+        # One keep-alive session for all API calls, so each request reuses
+        # a warm TCP/TLS connection instead of opening a new one
+        self.session = requests.Session()
+        # pool_block=True: once all 16 pooled connections are busy, further
+        # requests wait for one to free up instead of opening extra
+        # connections that would be discarded afterwards
+        adapter = HTTPAdapter(pool_connections=4,
+                              pool_maxsize=16,
+                              pool_block=True,
+                              # Never retry read timeouts: read=False re-raises the
+                              # first one (requests' Timeout) instead of stalling
+                              # callers 3x as long and ending in a ConnectionError
+                              max_retries=Retry(total=2, read=False, backoff_factor=0.2))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
     
+    def _auth_params(self):
+        """Get the (token, salt) pair, regenerating it every 60 seconds"""
+        now = time.monotonic()
+        if self._auth is None or now - self._auth_ts >= 60:
+            salt = secrets.token_hex(3)
+            token = hashlib.md5((self.password + salt).encode(), usedforsecurity=False).hexdigest()
+            self._auth = (token, salt)
+            self._auth_ts = now
+        return self._auth
+
     def _make_request(self, endpoint, params=None):
         """Make authenticated request to Navidrome"""
         if params is None:
             params = {}
 
         # Generate authentication token
-        salt = ''.join(random.choices(string.ascii_letters + string.digits, k=6))
-        token = hashlib.md5((self.password + salt).encode()).hexdigest()
+        token, salt = self._auth_params()
 
         # Add required params
         params.update({
@@ -35,12 +89,13 @@ class NavidromeClient:
         })
 
         url = f"{self.base_url}/rest/{endpoint}"
-        logger.debug(f"API Request: {endpoint}")
+        logger.debug("API Request: %s", endpoint)
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            # orjson parses the raw bytes directly and is much faster on big listings
+            data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
 
             # Check for Subsonic API errors
             subsonic_response = data.get('subsonic-response', {})
@@ -49,7 +104,7 @@ class NavidromeClient:
                 logger.error(f"API Error on {endpoint}: {error.get('message', 'Unknown error')}")
                 raise Exception(f"API Error: {error.get('message', 'Unknown error')}")
 
-            logger.debug(f"API Response: {endpoint} - success")
+            logger.debug("API Response: %s - success", endpoint)
             return subsonic_response
 
         except requests.exceptions.Timeout:
@@ -106,7 +161,34 @@ class NavidromeClient:
             offset += batch_size
 
         return all_albums
-    
+
+    def get_all_albums_parallel(self, workers=None):
+        """Get all albums, fetching several 500-album pages at once
+
+        Pages are requested speculatively in rounds of `workers` until one
+        comes back short, so large libraries load in a few round-trips.
+        The cost: the last round can request up to workers - 1 pages past
+        the end of the library. Libraries under 500 albums need only the
+        first (serial) request.
+        """
+        workers = workers or config.NAVIDROME_PARALLELISM
+        batch_size = 500
+
+        all_albums = self.get_albums(limit=batch_size, offset=0)
+        if len(all_albums) < batch_size:
+            return all_albums
+
+        offset = batch_size
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                offsets = range(offset, offset + workers * batch_size, batch_size)
+                batches = executor.map(lambda o: self.get_albums(limit=batch_size, offset=o), offsets)
+                for batch in batches:
+                    all_albums.extend(batch)
+                    if len(batch) < batch_size:
+                        return all_albums
+                offset += workers * batch_size
+
     def get_artists(self):
         """Get list of all artists"""
         try:
@@ -177,24 +259,9 @@ class NavidromeClient:
     def get_stream_url(self, song_id):
         """Get streaming URL for a song"""
         try:
-            # Generate auth params for streaming
-            salt = ''.join(random.choices(string.ascii_letters + string.digits, k=6))
-            token = hashlib.md5((self.password + salt).encode()).hexdigest()
-            
-            params = {
-                'id': song_id,
-                'u': self.username,
-                't': token,
-                's': salt,
-                'v': self.api_version,
-                'c': self.client_name,
-                'format': 'mp3',  # Request mp3 format
-                'maxBitRate': '320'  # High quality
-            }
-            
-            # Build URL with params
-            param_string = '&'.join([f"{k}={v}" for k, v in params.items()])
-            return f"{self.base_url}/rest/stream?{param_string}"
+            token, salt = self._auth_params()
+            # mp3 at up to 320 kbps (high quality) - fixed part is in the prefix
+            return f"{self._stream_prefix}&{urlencode({'id': song_id, 't': token, 's': salt})}"
         
         except Exception as e:
             print(f"Error getting stream URL: {e}")
@@ -205,22 +272,8 @@ class NavidromeClient:
         if not cover_art_id:
             return None
         try:
-            # Generate auth params
-            salt = ''.join(random.choices(string.ascii_letters + string.digits, k=6))
-            token = hashlib.md5((self.password + salt).encode()).hexdigest()
-            
-            params = {
-                'id': cover_art_id,
-                'size': size,
-                'u': self.username,
-                't': token,
-                's': salt,
-                'v': self.api_version,
-                'c': self.client_name
-            }
-            
-            param_string = '&'.join([f"{k}={v}" for k, v in params.items()])
-            return f"{self.base_url}/rest/getCoverArt?{param_string}"
+            token, salt = self._auth_params()
+            return f"{self._cover_prefix}&{urlencode({'id': cover_art_id, 'size': size, 't': token, 's': salt})}"
         
         except Exception as e:
             print(f"Error getting cover art: {e}")
@@ -1,86 +1,313 @@
 import curses
+import re
+import threading
 import unicodedata
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import accumulate
 from ui.theme import *
-from player.album_art import AlbumArtDisplay
+from player.album_art import AlbumArtDisplay, PIL_AVAILABLE
 from player.bluetooth import BluetoothManager
 
+# Width (1 or 2) of every BMP code point, indexed by ord(); built on first use
+_WIDTH_LUT = None
+
+def _build_width_lut():
+    """Build the BMP width table from the Unicode database (once)"""
+    global _WIDTH_LUT
+    # Below U+1100 everything is narrow (some Unicode databases report a
+    # few unassigned code points there as wide) - matches _char_width
+    _WIDTH_LUT = bytes(2 if cp >= 0x1100 and unicodedata.east_asian_width(chr(cp)) in ('F', 'W')
+                       else 1 for cp in range(0x10000))
+    return _WIDTH_LUT
+
+# Character class of all wide BMP code points (compiled on first use) and
+# of everything above the BMP, whose width is looked up per character
+_WIDE_RE = None
+_ASTRAL_RE = re.compile('[\U00010000-\U0010FFFF]')
+
+def _build_wide_re():
+    """Compile the wide-character regex from runs of 2s in the width table"""
+    global _WIDE_RE
+    lut = _WIDTH_LUT or _build_width_lut()
+    ranges = []
+    cp = 0
+    while cp < 0x10000:
+        if lut[cp] == 2:
+            end = cp
+            while end + 1 < 0x10000 and lut[end + 1] == 2:
+                end += 1
+            ranges.append(f"{re.escape(chr(cp))}-{re.escape(chr(end))}")
+            cp = end
+        cp += 1
+    _WIDE_RE = re.compile(f"[{''.join(ranges)}]")
+    return _WIDE_RE
+
+# Sorted (start, end) bounds of the wide runs in planes 1-3 (emoji, CJK
+# extensions); nothing above plane 3 is wide. Built on first use.
+_ASTRAL_STARTS = _ASTRAL_ENDS = None
+
+def _build_astral_ranges():
+    """Coalesce the wide code points of planes 1-3 into sorted runs"""
+    global _ASTRAL_STARTS, _ASTRAL_ENDS
+    starts, ends = [], []
+    in_run = False
+    for cp in range(0x10000, 0x40000):
+        wide = unicodedata.east_asian_width(chr(cp)) in ('F', 'W')
+        if wide and not in_run:
+            starts.append(cp)
+        elif in_run and not wide:
+            ends.append(cp - 1)
+        in_run = wide
+    if in_run:
+        ends.append(0x3FFFF)
+    _ASTRAL_STARTS, _ASTRAL_ENDS = starts, ends
+    return starts
+
+def _astral_width(char):
+    """Display width of a character outside the BMP (emoji, rare CJK)"""
+    cp = ord(char)
+    i = bisect_right(_ASTRAL_STARTS or _build_astral_ranges(), cp) - 1
+    return 2 if i >= 0 and cp <= _ASTRAL_ENDS[i] else 1
+
+def _char_width(char):
+    """Display width of a single character: 2 for Full-width/Wide, else 1"""
+    cp = ord(char)
+    if cp < 0x1100:
+        return 1  # Nothing below U+1100 (Hangul Jamo) is wide - skip the table
+    if cp < 0x10000:
+        return (_WIDTH_LUT or _build_width_lut())[cp]
+    return _astral_width(char)
+
+@lru_cache(maxsize=2048)
 def display_width(text):
     """Calculate the display width of a string, accounting for wide characters"""
-    width = 0
-    for char in text:
-        if unicodedata.east_asian_width(char) in ('F', 'W'):
-            width += 2  # Full-width or Wide characters
-        else:
-            width += 1  # Normal width
+    if text.isascii():
+        return len(text)
+    # One regex pass counts the wide characters - each adds one extra cell
+    width = len(text) + len((_WIDE_RE or _build_wide_re()).findall(text))
+    for char in _ASTRAL_RE.findall(text):
+        width += _astral_width(char) - 1
     return width
 
+@lru_cache(maxsize=1024)
 def truncate_to_width(text, max_width):
     """Truncate text to fit within max_width, accounting for wide characters"""
-    if display_width(text) <= max_width:
+    if text.isascii():
+        # The common case: one cell per character
+        return text if len(text) <= max_width else text[:max(0, max_width - 3)] + "..."
+
+    width = display_width(text)
+    if width <= max_width:
         return text
 
-    current_width = 0
-    result = ""
     ellipsis = "..."
     ellipsis_width = display_width(ellipsis)
-
-    for char in text:
-        char_width = 2 if unicodedata.east_asian_width(char) in ('F', 'W') else 1
-        if current_width + char_width + ellipsis_width > max_width:
-            return result + ellipsis
-        result += char
-        current_width += char_width
-
-    return result
+    if width == len(text):
+        # No wide characters - one cell per character, so just slice
+        return text[:max(0, max_width - ellipsis_width)] + ellipsis
+
+    # Cut before the first character whose running width leaves no room
+    # for the ellipsis - a bisect over the prefix sums, no per-char loop
+    cumulative = list(accumulate(map(_char_width, text)))
+    return text[:bisect_right(cumulative, max_width - ellipsis_width)] + ellipsis
+
+@lru_cache(maxsize=32)
+def _marquee_text(text):
+    """text looped once with a 3-space gap - the strip the marquee window slides over"""
+    return text + "   " + text
+
+def _scroll_window(text, offset, max_width):
+    """Marquee window over text: offset cells into the loop, at most max_width cells wide
+
+    Every frame of the loop is sliced once per (text, max_width); a tick
+    is then a single list lookup.
+    """
+    return _marquee_frames(text, max_width)[offset]
+
+@lru_cache(maxsize=32)
+def _marquee_frames(text, max_width):
+    """All marquee windows over text, indexed by scroll offset (0 .. width + 2)"""
+    scrolling_text = _marquee_text(text)
+    offsets = range(display_width(text) + 3)
+    if scrolling_text.isascii():
+        # One cell per character - cells and indices line up
+        return [scrolling_text[offset:offset + max_width] for offset in offsets]
+
+    # Binary-search the cumulative widths for each window's start and end
+    cumulative = _cumulative_widths(scrolling_text)
+    frames = []
+    for offset in offsets:
+        start = min(bisect_left(cumulative, offset) + 1, len(cumulative)) if offset > 0 else 0
+        base = cumulative[start - 1] if start else 0
+        frames.append(scrolling_text[start:bisect_right(cumulative, base + max_width)])
+    return frames
+
+@lru_cache(maxsize=32)
+def _cumulative_widths(text):
+    """Running display width after each character of text (marquee strings)"""
+    return list(accumulate(map(_char_width, text)))
+
+# Labels built from theme symbols - formatted once, not on every frame
+_MAIN_HEADER = f"{SYMBOL_MUSIC} MUSIC PLAYER"
+_STATUS_PLAYING = f"{SYMBOL_PLAYING} PLAYING"
+_STATUS_PAUSED = f"{SYMBOL_PAUSED} PAUSED"
+
+# Key codes checked in handle_input
+_KEY_ENTER = ord('\n')
+_KEY_SPACE = ord(' ')
+_KEYS_QUIT = frozenset((ord('q'), ord('Q')))
+_KEYS_BACK = frozenset((curses.KEY_BACKSPACE, 127))
 
 class BaseScreen:
     """Base class for all screens"""
+    _frame_owner = None  # Screen that drew what is currently on stdscr
+    _draw_lock = threading.RLock()  # Held for a whole draw(), see draw
+
     def __init__(self, stdscr):
         self.stdscr = stdscr
-        self.height, self.width = stdscr.getmaxyx()
         self._pending_action = None
+        self.height = self.width = None
+        self._shadow = None  # Rows drawn in the last frame: {y: [(x, text, attr), ...]}
+        self._frame = None   # Rows being drawn in the current frame
+        self._dirty = True   # Visible state changed since the last draw()
+        self._battery_key = self._footer_key = None  # Inputs of the cached layouts
+        self._sync_size()
+
+        # Attributes are fixed once the color pairs exist - compute them once
+        self._attr_normal = curses.color_pair(COLOR_NORMAL)
+        self._attr_dim = self._attr_normal | curses.A_DIM
+        self._attr_accent = curses.color_pair(COLOR_SELECTED)
+        self._attr_selected = self._attr_accent | curses.A_BOLD
+        self._attr_status = curses.color_pair(COLOR_STATUS)
+        self._attr_status_bold = self._attr_status | curses.A_BOLD
+        self._attr_playing = curses.color_pair(COLOR_PLAYING)
+        self._attr_playing_bold = self._attr_playing | curses.A_BOLD
+
+    def _sync_size(self):
+        """Pick up terminal resizes; a new size forces a full redraw"""
+        height, width = self.stdscr.getmaxyx()
+        if (height, width) != (self.height, self.width):
+            self._shadow = None
+            self._dirty = True
+        self.height, self.width = height, width
+
+    def _begin_frame(self):
+        """Start a diffed frame - draw with _put(), then call _end_frame()
+
+        The screen is only wiped when another screen drew last or the
+        terminal was resized; otherwise rows are compared with the last frame.
+        """
+        self._sync_size()
+        if BaseScreen._frame_owner is not self or self._shadow is None:
+            self.stdscr.erase()
+            self._shadow = {}
+            BaseScreen._frame_owner = self
+        self._frame = {}
+
+    def _erase(self):
+        """Blank the whole screen for an undiffed (full) redraw"""
+        self.stdscr.erase()
+        self._shadow = None
+        BaseScreen._frame_owner = self
+
+    def _needs_redraw(self):
+        """True unless this screen's last frame is still up and nothing changed"""
+        self._sync_size()
+        if self._dirty or BaseScreen._frame_owner is not self:
+            self._dirty = False
+            return True
+        return False
+
+    def _put(self, y, x, text, attr=0):
+        """addstr(), deferred to _end_frame() while a diffed frame is open"""
+        if self._frame is None:
+            self.stdscr.addstr(y, x, text, attr)
+        else:
+            self._frame.setdefault(y, []).append((x, text, attr))
+
+    def _end_frame(self):
+        """Rewrite only the rows that changed since the last frame, then refresh"""
+        frame, shadow = self._frame, self._shadow
+        self._frame = None
+        for y, cells in frame.items():
+            if shadow.get(y) == cells:
+                continue
+            self.stdscr.move(y, 0)
+            self.stdscr.clrtoeol()
+            for x, text, attr in cells:
+                try:
+                    self.stdscr.addstr(y, x, text, attr)
+                except curses.error:
+                    pass  # Ignore if text doesn't fit
+        for y in shadow.keys() - frame.keys():
+            self.stdscr.move(y, 0)
+            self.stdscr.clrtoeol()
+        self._shadow = frame
+        self.stdscr.refresh()
 
     def draw_status_bar(self, text, battery_percent=None):
         """Draw status bar at top"""
-        self.stdscr.addstr(0, 0, " " * (self.width - 1))
-        self.stdscr.addstr(0, 2, text, curses.color_pair(COLOR_STATUS) | curses.A_BOLD)
+        # The row is already blank (erase() or the frame diff cleared it),
+        # so only the text itself is written - no full-width space fill
+        self._sync_size()
+        self._put(0, 2, text, self._attr_status_bold)
 
         if battery_percent is not None:
-            battery_text = f"{battery_percent}% {SYMBOL_BATTERY}"
-            self.stdscr.addstr(0, self.width - len(battery_text) - 2,
-                             battery_text, curses.color_pair(COLOR_STATUS))
+            # The battery label only changes when the reading or width does
+            key = (battery_percent, self.width)
+            if key != self._battery_key:
+                battery_text = f"{battery_percent}% {SYMBOL_BATTERY}"
+                self._battery_key = key
+                self._battery_cell = (self.width - len(battery_text) - 2, battery_text)
+            x, battery_text = self._battery_cell
+            self._put(0, x, battery_text, self._attr_status)
 
     def draw_footer(self, btn1="", btn2="", btn3="", btn4=""):
         """Draw footer with evenly spaced GPIO button labels
 
         Displays 4 button actions evenly spaced across the bottom
         to match the physical GPIO button layout (left to right).
+        Label positions are laid out once per label set and screen size.
         """
         footer_y = self.height - 1
-        self.stdscr.addstr(footer_y, 0, " " * (self.width - 1))
-
-        labels = [btn1, btn2, btn3, btn4]
-
-        # Calculate positions to distribute evenly across the width
-        # Place at 1/8, 3/8, 5/8, 7/8 of width (centered in each quarter)
-        positions = [
-            self.width // 8,
-            (self.width * 3) // 8,
-            (self.width * 5) // 8,
-            (self.width * 7) // 8
-        ]
-
-        for i, label in enumerate(labels):
-            if label:  # Only show if label is provided
-                # Center the label at its position
-                x_pos = positions[i] - len(label) // 2
-                x_pos = max(0, min(x_pos, self.width - len(label) - 1))
-                try:
-                    self.stdscr.addstr(footer_y, x_pos, label)
-                except:
-                    pass  # Ignore if text doesn't fit
+
+        key = (btn1, btn2, btn3, btn4, self.width)
+        if key != self._footer_key:
+            self._footer_key = key
+            self._footer_cells = []
+
+            # Calculate positions to distribute evenly across the width
+            # Place at 1/8, 3/8, 5/8, 7/8 of width (centered in each quarter)
+            positions = [
+                self.width // 8,
+                (self.width * 3) // 8,
+                (self.width * 5) // 8,
+                (self.width * 7) // 8
+            ]
+
+            for i, label in enumerate((btn1, btn2, btn3, btn4)):
+                if label:  # Only show if label is provided
+                    # Center the label at its position
+                    x_pos = positions[i] - len(label) // 2
+                    x_pos = max(0, min(x_pos, self.width - len(label) - 1))
+                    # Drop labels that can't fit (very narrow terminal)
+                    if x_pos + display_width(label) < self.width:
+                        self._footer_cells.append((x_pos, label))
+
+        for x_pos, label in self._footer_cells:
+            self._put(footer_y, x_pos, label)
 
     def draw(self):
+        """Draw the screen (override _draw)
+
+        Both the main loop and the GPIO button thread call this; one lock
+        for all screens keeps their frames (and stdscr) from interleaving.
+        """
+        with BaseScreen._draw_lock:
+            self._draw()
+
+    def _draw(self):
         """Override this in subclasses"""
         pass
 
@@ -113,42 +340,45 @@ class MainMenuScreen(BaseScreen):
         self.menu_items = ["Albums", "Playlists", "Artists", "Settings"]
         self.selected = 0
 
-    def draw(self):
-        self.stdscr.clear()
-        self.draw_status_bar(f"{SYMBOL_MUSIC} MUSIC PLAYER")
+    def _draw(self):
+        # Only the previously and newly selected rows get rewritten on a move
+        self._begin_frame()
+        self.draw_status_bar(_MAIN_HEADER)
 
         # Draw menu items
         start_y = 3
         for i, item in enumerate(self.menu_items):
             y = start_y + (i * 2)
             if i == self.selected:
-                self.stdscr.addstr(y, 8, f"> {item}",
-                                 curses.color_pair(COLOR_SELECTED) | curses.A_BOLD)
+                self._put(y, 8, "> " + item,
+                          self._attr_selected)
             else:
-                self.stdscr.addstr(y, 10, item, curses.color_pair(COLOR_NORMAL))
+                self._put(y, 10, item, self._attr_normal)
 
         self.draw_footer("↑", "↓", "Enter", "Quit")
-        self.stdscr.refresh()
+        self._end_frame()
 
     def handle_input(self, key):
         if key == curses.KEY_UP:
             self.selected = max(0, self.selected - 1)
         elif key == curses.KEY_DOWN:
             self.selected = min(len(self.menu_items) - 1, self.selected + 1)
-        elif key == ord('\n'):  # Enter key
+        elif key == _KEY_ENTER:  # Enter key
             return self.menu_items[self.selected]  # Return selected menu
-        elif key == ord('q') or key == ord('Q'):
+        elif key in _KEYS_QUIT:
             return False
         return True
     
     # Button support
     def on_up(self):
-        self.selected = max(0, self.selected - 1)
-        self.draw()
+        if self.selected > 0:
+            self.selected -= 1
+            self.draw()
     
     def on_down(self):
-        self.selected = min(len(self.menu_items) - 1, self.selected + 1)
-        self.draw()
+        if self.selected < len(self.menu_items) - 1:
+            self.selected += 1
+            self.draw()
     
     def on_select(self):
         self._pending_action = self.menu_items[self.selected]
@@ -167,6 +397,8 @@ class AlbumBrowserScreen(BaseScreen):
         self.scroll_offset = 0
         self.scroll_frame = 0
         self.last_album_index = 0
+        self._album_rows = {}  # index -> (line, selected_line, full_text), see _album_row
+        self._rows_width = None
 
     def _get_scrolled_text(self, text, max_width, is_selected):
         """Get scrolling text for selected items with truncated content
@@ -185,143 +417,125 @@ class AlbumBrowserScreen(BaseScreen):
         # Increment scroll offset
         self.scroll_offset = (self.scroll_offset + 1) % (text_width + 3)
 
-        # Create circular scrolling effect
-        # Add padding between end and start
-        scrolling_text = text + "   " + text
-
-        # Calculate starting position in the scrolling text
-        start_offset = self.scroll_offset
-
-        # Extract visible portion
-        visible_text = ""
-        current_width = 0
-        char_index = 0
-
-        # Skip to starting offset
-        temp_offset = 0
-        while temp_offset < start_offset and char_index < len(scrolling_text):
-            char = scrolling_text[char_index]
-            char_width = 2 if unicodedata.east_asian_width(char) in ('F', 'W') else 1
-            temp_offset += char_width
-            char_index += 1
-
-        # Collect visible characters
-        while current_width < max_width and char_index < len(scrolling_text):
-            char = scrolling_text[char_index]
-            char_width = 2 if unicodedata.east_asian_width(char) in ('F', 'W') else 1
-            if current_width + char_width > max_width:
-                break
-            visible_text += char
-            current_width += char_width
-            char_index += 1
+        return _scroll_window(text, self.scroll_offset, max_width)
 
-        return visible_text
+    def _album_row(self, i):
+        """Formatted row for album i: album left-aligned, artist right-aligned
+
+        Rows are built once per terminal width and reused across redraws.
+        Returns (line, selected_line, full_text): the row with its "  " and
+        "> " prefixes, and the combined "album - artist" string when it
+        needs scrolling while selected (else None).
+        """
+        if self.width != self._rows_width:
+            self._album_rows.clear()
+            self._rows_width = self.width
+            # Full width minus x offset, right margin and "> " prefix
+            self._line_width = self.width - 2 - 2 - 2
+            # Reserve space for artist (right-aligned) - use 40% of width
+            self._artist_width = int(self._line_width * 0.4)
+            self._album_width = self._line_width - self._artist_width - 1  # -1 for space separator
+
+        row = self._album_rows.get(i)
+        if row is not None:
+            return row
+
+        album = self.albums[i]
+        artist = album.get('artist', 'Unknown Artist')
+        album_name = album['name']
+        max_line_width = self._line_width
+
+        artist_display = truncate_to_width(artist, self._artist_width)
+        album_display = truncate_to_width(album_name, self._album_width)
+
+        # Pad the album so the artist ends up right-justified
+        album_column = max_line_width - display_width(artist_display) - 1
+        album_display_width = display_width(album_display)
+        if album_display_width == len(album_display):
+            # One cell per character - str.ljust pads in C
+            album_display = album_display.ljust(album_column)
+        else:
+            album_display += " " * max(0, album_column - album_display_width)
+        row_text = album_display + " " + artist_display
+
+        full_text = f"{album_name} - {artist}"
+        if display_width(full_text) <= max_line_width:
+            full_text = None
+
+        row = self._album_rows[i] = ("  " + row_text, "> " + row_text, full_text)
+        return row
+
+    def _draw(self):
+        # Idle ticks only need a frame while the selected row is scrolling
+        if not self._needs_redraw() and self._album_row(self.album_index)[2] is None:
+            return
 
-    def draw(self):
         # Reset scroll if selection changed
         if self.album_index != self.last_album_index:
             self.scroll_offset = 0
             self.scroll_frame = 0
             self.last_album_index = self.album_index
 
-        self.stdscr.clear()
+        self._begin_frame()
         self.draw_status_bar("Albums")
 
         # Draw albums (full width)
-        self.stdscr.addstr(2, 2, "Albums:", curses.A_BOLD)
+        self._put(2, 2, "Albums:", curses.A_BOLD)
+        # Loop invariants: visible range (up to 10 rows, stopping above the
+        # footer), selection and the attribute for unselected rows
         start = max(0, self.album_index - 5)
-        for i in range(start, min(len(self.albums), start + 10)):
+        end = min(len(self.albums), start + 10, start + self.height - 6)
+        selected = self.album_index
+        put = self._put
+        attr_normal = self._attr_normal
+        for i in range(start, end):
             y = 4 + (i - start)
-            if y >= self.height - 2:
-                break
-
-            # Format album display with right-justified artist
-            album = self.albums[i]
-            artist = album.get('artist', 'Unknown Artist')
-            album_name = album['name']
-
-            # Calculate available space (full width)
-            is_selected = i == self.album_index
-            prefix = "> " if is_selected else "  "
-            x_start = 2
-
-            # Calculate max width for content (full width of screen)
-            max_line_width = self.width - x_start - 2 - display_width(prefix)
-
-            # Reserve space for artist (right-aligned) - use 40% of width
-            artist_width = int(max_line_width * 0.4)
-            album_width = max_line_width - artist_width - 1  # -1 for space separator
-
-            # Truncate or scroll artist (right side)
-            artist_display = truncate_to_width(artist, artist_width)
-            artist_display_width = display_width(artist_display)
-
-            # Display album and artist
-            if is_selected:
-                # For selected item, check if scrolling is needed
-                full_text = f"{album_name} - {artist}"
-                full_text_width = display_width(full_text)
-
-                if full_text_width > max_line_width:
+            line, selected_line, full_text = self._album_row(i)
+            if i == selected:
+                if full_text is not None:
                     # Scroll the combined text
-                    display_text = self._get_scrolled_text(full_text, max_line_width, True)
-                else:
-                    # Fits without scrolling - maintain right-justified layout
-                    album_display = truncate_to_width(album_name, album_width)
-                    album_display_width = display_width(album_display)
-
-                    padding_needed = max_line_width - album_display_width - artist_display_width - 1
-                    if padding_needed < 0:
-                        padding_needed = 0
-
-                    display_text = album_display + (" " * padding_needed) + " " + artist_display
-
-                self.stdscr.addstr(y, x_start, f"{prefix}{display_text}",
-                                 curses.color_pair(COLOR_SELECTED) | curses.A_BOLD)
+                    selected_line = "> " + self._get_scrolled_text(full_text, self._line_width, True)
+                put(y, 2, selected_line, self._attr_selected)
             else:
-                # Not selected - show album left-aligned, artist right-aligned
-                album_display = truncate_to_width(album_name, album_width)
-                album_display_width = display_width(album_display)
-
-                # Calculate padding to right-justify artist
-                padding_needed = max_line_width - album_display_width - artist_display_width - 1
-                if padding_needed < 0:
-                    padding_needed = 0
-
-                display_text = album_display + (" " * padding_needed) + " " + artist_display
-
-                self.stdscr.addstr(y, x_start, f"{prefix}{display_text}",
-                                 curses.color_pair(COLOR_NORMAL))
+                put(y, 2, line, attr_normal)
 
         self.draw_footer("↑", "↓", "Select", "Back")
-        self.stdscr.refresh()
+        self._end_frame()
 
     def handle_input(self, key):
         if key == curses.KEY_UP:
-            self.album_index = max(0, self.album_index - 1)
+            if self.album_index > 0:
+                self.album_index -= 1
+                self._dirty = True
 
         elif key == curses.KEY_DOWN:
-            self.album_index = min(len(self.albums) - 1, self.album_index + 1)
+            if self.album_index < len(self.albums) - 1:
+                self.album_index += 1
+                self._dirty = True
 
-        elif key == ord('\n'):  # Enter
+        elif key == _KEY_ENTER:  # Enter
             return ("select_album", self.albums[self.album_index])
 
-        elif key == curses.KEY_BACKSPACE or key == 127:
+        elif key in _KEYS_BACK:
             return "back"
 
-        elif key == ord('q') or key == ord('Q'):
+        elif key in _KEYS_QUIT:
             return False
 
         return True
 
     # Button support
     def on_up(self):
-        self.album_index = max(0, self.album_index - 1)
-        self.draw()
+        if self.album_index > 0:
+            self.album_index -= 1
+            self._dirty = True
+            self.draw()
 
     def on_down(self):
-        self.album_index = min(len(self.albums) - 1, self.album_index + 1)
-        self.draw()
+        if self.album_index < len(self.albums) - 1:
+            self.album_index += 1
+            self._dirty = True
+            self.draw()
 
     def on_select(self):
         self._pending_action = ("select_album", self.albums[self.album_index])
@@ -340,6 +554,8 @@ class SongListScreen(BaseScreen):
         self.scroll_offset = 0
         self.scroll_frame = 0
         self.last_song_index = 0
+        self._song_rows = {}  # index -> (line, selected_line, full_text), see _song_row
+        self._rows_width = None
 
     def _get_scrolled_text(self, text, max_width, is_selected):
         """Get scrolling text for selected items with truncated content"""
@@ -349,110 +565,113 @@ class SongListScreen(BaseScreen):
             return truncate_to_width(text, max_width)
 
         self.scroll_offset = (self.scroll_offset + 1) % (text_width + 3)
-        scrolling_text = text + "   " + text
-        start_offset = self.scroll_offset
-
-        visible_text = ""
-        current_width = 0
-        char_index = 0
-
-        temp_offset = 0
-        while temp_offset < start_offset and char_index < len(scrolling_text):
-            char = scrolling_text[char_index]
-            char_width = 2 if unicodedata.east_asian_width(char) in ('F', 'W') else 1
-            temp_offset += char_width
-            char_index += 1
-
-        while current_width < max_width and char_index < len(scrolling_text):
-            char = scrolling_text[char_index]
-            char_width = 2 if unicodedata.east_asian_width(char) in ('F', 'W') else 1
-            if current_width + char_width > max_width:
-                break
-            visible_text += char
-            current_width += char_width
-            char_index += 1
+        return _scroll_window(text, self.scroll_offset, max_width)
 
-        return visible_text
+    def _song_row(self, i):
+        """Formatted row for song i, built once per terminal width
+
+        Returns (line, selected_line, full_text) like AlbumBrowserScreen._album_row:
+        full_text is set only when the text needs scrolling while selected.
+        """
+        if self.width != self._rows_width:
+            self._song_rows.clear()
+            self._rows_width = self.width
+            # Full width minus x offset, right margin and "> " prefix
+            self._line_width = self.width - 2 - 2 - 2
+            # Reserve space for artist (right-aligned) - use 40% of width
+            self._artist_width = int(self._line_width * 0.4)
+            self._album_width = self._line_width - self._artist_width - 1  # -1 for space separator
+
+        row = self._song_rows.get(i)
+        if row is not None:
+            return row
+
+        song = self.songs[i]
+        track_num = song.get('track', '')
+        title = song.get('title', 'Unknown')
+        artist = song.get('artist', 'Unknown Artist')
+
+        # Build display text with track number if available
+        if track_num:
+            full_text = f"{track_num}. {title} - {artist}"
+        else:
+            full_text = f"{title} - {artist}"
+
+        text = truncate_to_width(full_text, self._line_width)
+        if text == full_text:
+            full_text = None
+
+        row = self._song_rows[i] = ("  " + text, "> " + text, full_text)
+        return row
+
+    def _draw(self):
+        # Idle ticks only need a frame while the selected row is scrolling
+        if not self._needs_redraw() and self._song_row(self.song_index)[2] is None:
+            return
 
-    def draw(self):
         # Reset scroll if selection changed
         if self.song_index != self.last_song_index:
             self.scroll_offset = 0
             self.scroll_frame = 0
             self.last_song_index = self.song_index
 
-        self.stdscr.clear()
+        self._begin_frame()
         album_name = self.album.get('name', 'Unknown Album')
         self.draw_status_bar(truncate_to_width(album_name, self.width - 10))
 
         # Draw songs (full width)
-        self.stdscr.addstr(2, 2, "Songs:", curses.A_BOLD)
+        self._put(2, 2, "Songs:", curses.A_BOLD)
+        # Visible songs: up to 10 rows, stopping above the footer
         start = max(0, self.song_index - 5)
-        for i in range(start, min(len(self.songs), start + 10)):
+        end = min(len(self.songs), start + 10, start + self.height - 6)
+        for i in range(start, end):
             y = 4 + (i - start)
-            if y >= self.height - 2:
-                break
-
-            song = self.songs[i]
-            track_num = song.get('track', '')
-            title = song.get('title', 'Unknown')
-            artist = song.get('artist', 'Unknown Artist')
-
-            # Build display text with track number if available
-            if track_num:
-                full_text = f"{track_num}. {title} - {artist}"
-            else:
-                full_text = f"{title} - {artist}"
-
-            is_selected = i == self.song_index
-            prefix = "> " if is_selected else "  "
-            x_start = 2
-
-            # Calculate max width for content (full width)
-            max_line_width = self.width - x_start - 2 - display_width(prefix)
-
-            # Scroll or truncate combined text
-            if is_selected:
-                display_text = self._get_scrolled_text(full_text, max_line_width, True)
-            else:
-                display_text = truncate_to_width(full_text, max_line_width)
-
-            if is_selected:
-                self.stdscr.addstr(y, x_start, f"{prefix}{display_text}",
-                                 curses.color_pair(COLOR_SELECTED) | curses.A_BOLD)
+            line, selected_line, full_text = self._song_row(i)
+            if i == self.song_index:
+                if full_text is not None:
+                    # Scroll the combined text
+                    selected_line = "> " + self._get_scrolled_text(full_text, self._line_width, True)
+                self._put(y, 2, selected_line, self._attr_selected)
             else:
-                self.stdscr.addstr(y, x_start, f"{prefix}{display_text}",
-                                 curses.color_pair(COLOR_NORMAL))
+                self._put(y, 2, line, self._attr_normal)
 
         self.draw_footer("↑", "↓", "Play", "Back")
-        self.stdscr.refresh()
+        self._end_frame()
 
     def handle_input(self, key):
         if key == curses.KEY_UP:
-            self.song_index = max(0, self.song_index - 1)
+            if self.song_index > 0:
+                self.song_index -= 1
+                self._dirty = True
 
         elif key == curses.KEY_DOWN:
-            self.song_index = min(len(self.songs) - 1, self.song_index + 1)
+            if self.song_index < len(self.songs) - 1:
+                self.song_index += 1
+                self._dirty = True
 
-        elif key == ord('\n'):  # Enter
+        elif key == _KEY_ENTER:  # Enter
             return ("play_song", self.songs[self.song_index])
 
-        elif key == curses.KEY_BACKSPACE or key == 127:
+        elif key in _KEYS_BACK:
             return "back"
 
-        elif key == ord('q') or key == ord('Q'):
+        elif key in _KEYS_QUIT:
             return False
 
         return True
 
     # Button support
     def on_up(self):
-        self.song_index = max(0, self.song_index - 1)
-        self.draw()
+        if self.song_index > 0:
+            self.song_index -= 1
+            self._dirty = True
+            self.draw()
 
     def on_down(self):
-        self.song_index = min(len(self.songs) - 1, self.song_index + 1)
-        self.draw()
+        if self.song_index < len(self.songs) - 1:
+            self.song_index += 1
+            self._dirty = True
+            self.draw()
 
     def on_select(self):
         self._pending_action = ("play_song", self.songs[self.song_index])
@@ -463,6 +682,12 @@ class SongListScreen(BaseScreen):
 
 class NowPlayingScreen(BaseScreen):
     """Now playing screen"""
+    # Fixed layout: album art on the left, song info to its right
+    ART_WIDTH = 20
+    ART_HEIGHT = 10
+    ART_X = 2
+    INFO_X = ART_X + ART_WIDTH + 2
+
     def __init__(self, stdscr, audio_player, navidrome_client=None):
         super().__init__(stdscr)
         self.player = audio_player
@@ -470,14 +695,50 @@ class NowPlayingScreen(BaseScreen):
         self.album_art = AlbumArtDisplay()
         self.current_art_path = None
         self.last_song_id = None  # Track which song we downloaded art for
+        self._art_lock = threading.Lock()
+        self._shown_state = None  # (song id, volume, paused, art path) last drawn
+        self._header_volume = None  # Volume the cached header text was built for
+        self._art_key = None  # (path, width, height) the cached art lines came from
+        self._art_lines = None
+        self._header_text = None
+
+    def _fetch_art(self, song_id, cover_art_id):
+        """Download a song's cover art (runs on a worker thread)"""
+        try:
+            with self._art_lock:  # One download at a time on quick skips
+                if song_id != self.last_song_id:
+                    return  # Skipped past while queued - don't fetch stale art
+                cover_art_url = self.client.get_cover_art_url(cover_art_id, size=200)
+                if not cover_art_url:
+                    return
+                # Download and cache the album art
+                art_path = self.album_art.download_cover_art(cover_art_url, cover_art_id)
+        except Exception:
+            return  # Silently fail - album art is optional
+        # Drop art for a song that's no longer playing
+        if art_path and song_id == self.last_song_id:
+            self.current_art_path = art_path
+
+    def _draw(self):
+        # The main loop calls this every 100ms - skip ticks where nothing
+        # shown (song, volume, pause state, art) has changed
+        song = self.player.current_song
+        state = (song.get('id') if song else None, self.player.volume,
+                 self.player.is_paused, self.current_art_path)
+        if state != self._shown_state:
+            self._shown_state = state
+            self._dirty = True
+        if not self._needs_redraw():
+            return
 
-    def draw(self):
-        self.stdscr.clear()
+        self._begin_frame()
 
-        # Show volume in header
-        vol_percent = int(self.player.volume)
-        header_text = f"Now Playing - Vol: {vol_percent}%"
-        self.draw_status_bar(header_text)
+        # Show volume in header - rebuilt only when the volume changes
+        volume = self.player.volume
+        if volume != self._header_volume:
+            self._header_volume = volume
+            self._header_text = f"Now Playing - Vol: {int(volume)}%"
+        self.draw_status_bar(self._header_text)
 
         if self.player.current_song:
             song = self.player.current_song
@@ -488,40 +749,36 @@ class NowPlayingScreen(BaseScreen):
 
             # Download album art only once per song
             song_id = song.get('id')
-            if self.client and song_id and song_id != self.last_song_id:
+            # (without PIL the art could only be shown as a placeholder box,
+            # so don't download it at all)
+            if PIL_AVAILABLE and self.client and song_id and song_id != self.last_song_id:
+                self.last_song_id = song_id
                 # Try different fields that might contain cover art ID
                 cover_art_id = song.get('coverArt') or song.get('albumId') or song_id
                 if cover_art_id:
-                    try:
-                        cover_art_url = self.client.get_cover_art_url(cover_art_id, size=200)
-                        if cover_art_url:
-                            # Download and cache the album art
-                            art_path = self.album_art.download_cover_art(cover_art_url, cover_art_id)
-                            if art_path:
-                                self.current_art_path = art_path
-                    except Exception as e:
-                        # Silently fail - album art is optional
-                        pass
-                    finally:
-                        self.last_song_id = song_id
+                    # Fetch off the UI thread - the art shows up on a later frame
+                    threading.Thread(target=self._fetch_art, args=(song_id, cover_art_id),
+                                     daemon=True).start()
 
             # Display album art if available
-            art_width = 20
-            art_height = 10
-            art_x_offset = 2
-            info_x_offset = art_x_offset + art_width + 2
+            art_width = self.ART_WIDTH
+            art_x_offset = self.ART_X
+            info_x_offset = self.INFO_X
 
             # Try to display album art
             if self.current_art_path:
                 try:
-                    art_lines = self.album_art.get_ascii_art(self.current_art_path, art_width, art_height)
+                    # Convert the image only when the art or its size changes
+                    art_key = (self.current_art_path, art_width, self.ART_HEIGHT)
+                    if art_key != self._art_key:
+                        self._art_lines = self.album_art.get_ascii_art(*art_key)
+                        self._art_key = art_key
+                    art_lines = self._art_lines
                     art_y = 3
-                    for i, line in enumerate(art_lines):
-                        if art_y + i < self.height - 2:
-                            try:
-                                self.stdscr.addstr(art_y + i, art_x_offset, line[:art_width])
-                            except:
-                                pass  # Ignore errors from characters that don't fit
+                    # Only the rows above the footer, and only if the art fits across
+                    if art_x_offset + art_width < self.width:
+                        for i, line in enumerate(art_lines[:max(0, self.height - 2 - art_y)]):
+                            self._put(art_y + i, art_x_offset, line[:art_width])
                 except:
                     pass  # Silently fail if album art can't be displayed
 
@@ -529,47 +786,51 @@ class NowPlayingScreen(BaseScreen):
             info_y = 3
             max_text_width = self.width - info_x_offset - 2
 
-            self.stdscr.addstr(info_y, info_x_offset, "Title:", curses.A_BOLD)
-            self.stdscr.addstr(info_y + 1, info_x_offset, truncate_to_width(title, max_text_width),
-                             curses.color_pair(COLOR_PLAYING))
+            self._put(info_y, info_x_offset, "Title:", curses.A_BOLD)
+            self._put(info_y + 1, info_x_offset, truncate_to_width(title, max_text_width),
+                      self._attr_playing)
 
-            self.stdscr.addstr(info_y + 3, info_x_offset, "Artist:", curses.A_BOLD)
-            self.stdscr.addstr(info_y + 4, info_x_offset, truncate_to_width(artist, max_text_width))
+            self._put(info_y + 3, info_x_offset, "Artist:", curses.A_BOLD)
+            self._put(info_y + 4, info_x_offset, truncate_to_width(artist, max_text_width))
 
-            self.stdscr.addstr(info_y + 6, info_x_offset, "Album:", curses.A_BOLD)
-            self.stdscr.addstr(info_y + 7, info_x_offset, truncate_to_width(album, max_text_width))
+            self._put(info_y + 6, info_x_offset, "Album:", curses.A_BOLD)
+            self._put(info_y + 7, info_x_offset, truncate_to_width(album, max_text_width))
 
             # Status
-            status = f"{SYMBOL_PLAYING} PLAYING" if not self.player.is_paused else f"{SYMBOL_PAUSED} PAUSED"
-            self.stdscr.addstr(info_y + 10, info_x_offset, status,
-                             curses.color_pair(COLOR_PLAYING) | curses.A_BOLD)
+            status = _STATUS_PAUSED if self.player.is_paused else _STATUS_PLAYING
+            self._put(info_y + 10, info_x_offset, status,
+                      self._attr_playing_bold)
         else:
-            self.stdscr.addstr(self.height // 2, 2, "No song playing")
+            self._put(self.height // 2, 2, "No song playing")
 
         self.draw_footer("Vol+", "Vol-", "Pause", "Exit")
-        self.stdscr.refresh()
+        self._end_frame()
 
     def handle_input(self, key):
-        if key == ord(' '):  # Spacebar
+        if key == _KEY_SPACE:  # Spacebar
             self.player.toggle_pause()
         elif key == curses.KEY_UP:
             self.player.volume_up()
         elif key == curses.KEY_DOWN:
             self.player.volume_down()
-        elif key == curses.KEY_BACKSPACE or key == 127:
+        elif key in _KEYS_BACK:
             return "back"
-        elif key == ord('q') or key == ord('Q'):
+        elif key in _KEYS_QUIT:
             return False
         return True
 
     # Button support
     def on_up(self):
+        volume = self.player.volume
         self.player.volume_up()
-        self.draw()
+        if self.player.volume != volume:  # Already at max - nothing to redraw
+            self.draw()
 
     def on_down(self):
+        volume = self.player.volume
         self.player.volume_down()
-        self.draw()
+        if self.player.volume != volume:  # Already at min - nothing to redraw
+            self.draw()
     
     def on_select(self):
         self.player.toggle_pause()
@@ -594,16 +855,21 @@ class BluetoothSettingsScreen(BaseScreen):
         self.scanning = False
         self.status_message = ""
         self.connected_device = None
+        self._connected_macs = set()  # Snapshot from the last _refresh_devices
+        self._device_rows = None  # [(line, selected_line, attr)], see _get_device_rows
+        self._rows_key = None
         self._refresh_devices()
 
     def _refresh_devices(self):
         """Refresh the device list"""
+        self._device_rows = None  # Connection/pairing state may have changed
         if not self.bt.bluetoothctl_available:
             self.status_message = "Bluetooth not available"
             return
 
         # Get connected devices
         connected = self.bt.get_connected_devices()
+        self._connected_macs = {mac for mac, _ in connected}
         if connected:
             self.connected_device = connected[0]  # First connected device
 
@@ -611,8 +877,35 @@ class BluetoothSettingsScreen(BaseScreen):
         self.devices = self.bt.scan_devices(duration=0)  # Quick list of known devices
         self.selected = min(self.selected, max(0, len(self.devices) - 1))
 
-    def draw(self):
-        self.stdscr.clear()
+    def _get_device_rows(self):
+        """Formatted, truncated device rows, rebuilt when the list or width changes
+
+        Device names and their connected/paired state only change on a
+        scan or (dis)connect, so the rows aren't reformatted every frame.
+        """
+        key = (len(self.devices), self.width)
+        if self._device_rows is None or key != self._rows_key:
+            max_width = self.width - 6
+            rows = []
+            for mac, name, paired in self.devices:
+                status = ""
+                if mac in self._connected_macs:
+                    status = " [CONNECTED]"
+                    attr = self._attr_playing
+                elif paired:
+                    status = " [PAIRED]"
+                    attr = self._attr_accent
+                else:
+                    attr = self._attr_normal
+                rows.append((truncate_to_width(f"  {name}{status}", max_width),
+                             truncate_to_width(f"> {name}{status}", max_width),
+                             attr))
+            self._device_rows = rows
+            self._rows_key = key
+        return self._device_rows
+
+    def _draw(self):
+        self._erase()
         self.draw_status_bar("Bluetooth Audio")
 
         if not self.bt.bluetoothctl_available:
@@ -626,9 +919,9 @@ class BluetoothSettingsScreen(BaseScreen):
         if self.connected_device:
             mac, name = self.connected_device
             self.stdscr.addstr(y, 2, "Connected:", curses.A_BOLD)
-            self.stdscr.addstr(y, 14, f"{name}", curses.color_pair(COLOR_PLAYING))
+            self.stdscr.addstr(y, 14, f"{name}", self._attr_playing)
             y += 1
-            self.stdscr.addstr(y, 2, f"({mac})", curses.color_pair(COLOR_NORMAL) | curses.A_DIM)
+            self.stdscr.addstr(y, 2, f"({mac})", self._attr_dim)
             y += 2
         else:
             self.stdscr.addstr(y, 2, "Not connected to any device", curses.A_DIM)
@@ -636,7 +929,7 @@ class BluetoothSettingsScreen(BaseScreen):
 
         # Status message
         if self.status_message:
-            self.stdscr.addstr(y, 2, self.status_message, curses.color_pair(COLOR_PLAYING))
+            self.stdscr.addstr(y, 2, self.status_message, self._attr_playing)
             y += 1
 
         if self.scanning:
@@ -648,25 +941,22 @@ class BluetoothSettingsScreen(BaseScreen):
         y += 2
 
         # Always show "Scan for devices" as first option
-        scan_selected = self.selected == 0
-        scan_text = "> [Scan for devices]" if scan_selected else "  [Scan for devices]"
-        if scan_selected:
-            self.stdscr.addstr(y, 4, scan_text, curses.color_pair(COLOR_SELECTED) | curses.A_BOLD)
+        if self.selected == 0:
+            self.stdscr.addstr(y, 4, "> [Scan for devices]", self._attr_selected)
         else:
-            self.stdscr.addstr(y, 4, scan_text, curses.color_pair(COLOR_NORMAL))
+            self.stdscr.addstr(y, 4, "  [Scan for devices]", self._attr_normal)
         y += 1
 
         # Show connected device disconnect option if connected
         if self.connected_device:
-            disconnect_selected = self.selected == 1
             mac, name = self.connected_device
-            disconnect_text = f"> [Disconnect {name}]" if disconnect_selected else f"  [Disconnect {name}]"
-            if disconnect_selected:
-                self.stdscr.addstr(y, 4, truncate_to_width(disconnect_text, self.width - 6),
-                                 curses.color_pair(COLOR_SELECTED) | curses.A_BOLD)
+            # Build and truncate the label once; only prefix and attr differ
+            if self.selected == 1:
+                prefix, attr = "> ", self._attr_selected
             else:
-                self.stdscr.addstr(y, 4, truncate_to_width(disconnect_text, self.width - 6),
-                                 curses.color_pair(COLOR_NORMAL))
+                prefix, attr = "  ", self._attr_normal
+            self.stdscr.addstr(y, 4, truncate_to_width(f"{prefix}[Disconnect {name}]", self.width - 6),
+                               attr)
             y += 1
 
         y += 1
@@ -677,38 +967,17 @@ class BluetoothSettingsScreen(BaseScreen):
         # Calculate offset for device list items
         device_offset = 2 if self.connected_device else 1
 
-        if self.devices:
-            for i, (mac, name, paired) in enumerate(self.devices):
-                # Make sure we don't draw beyond the footer
-                if y >= self.height - 2:
-                    break
-
-                list_index = i + device_offset
-                is_selected = list_index == self.selected
-                prefix = "> " if is_selected else "  "
-
-                # Show device name
-                status = ""
-                if self.bt.is_connected(mac):
-                    status = " [CONNECTED]"
-                    color = COLOR_PLAYING
-                elif paired:
-                    status = " [PAIRED]"
-                    color = COLOR_SELECTED
-                else:
-                    color = COLOR_NORMAL
-
-                display_text = f"{prefix}{name}{status}"
-                max_width = self.width - 6
+        for i, (line, selected_line, attr) in enumerate(self._get_device_rows()):
+            # Make sure we don't draw beyond the footer
+            if y >= self.height - 2:
+                break
 
-                if is_selected:
-                    self.stdscr.addstr(y, 4, truncate_to_width(display_text, max_width),
-                                     curses.color_pair(COLOR_SELECTED) | curses.A_BOLD)
-                else:
-                    self.stdscr.addstr(y, 4, truncate_to_width(display_text, max_width),
-                                     curses.color_pair(color))
+            if i + device_offset == self.selected:
+                self.stdscr.addstr(y, 4, selected_line, self._attr_selected)
+            else:
+                self.stdscr.addstr(y, 4, line, attr)
 
-                y += 1
+            y += 1
 
         self.draw_footer("↑", "↓", "Select", "Back")
         self.stdscr.refresh()
@@ -724,15 +993,19 @@ class BluetoothSettingsScreen(BaseScreen):
         elif key == curses.KEY_DOWN:
             self.selected = min(max_selection, self.selected + 1)
 
-        elif key == ord('\n'):  # Enter/SELECT button
+        elif key == _KEY_ENTER:  # Enter/SELECT button
             if self.selected == 0:
                 # Scan for devices option
                 self.scanning = True
                 self.status_message = "Scanning..."
                 self.draw()
-                self.stdscr.refresh()
 
-                self.devices = self.bt.scan_devices(duration=5)
+                # Show devices as they're discovered instead of after the full scan
+                self.devices = []
+                for device in self.bt.iter_scan_devices(duration=5):
+                    self.devices.append(device)
+                    self.status_message = f"Scanning... {len(self.devices)} found"
+                    self.draw()
                 self.scanning = False
                 self.status_message = f"Found {len(self.devices)} device(s)"
                 self._refresh_devices()
@@ -742,7 +1015,6 @@ class BluetoothSettingsScreen(BaseScreen):
                 mac, name = self.connected_device
                 self.status_message = f"Disconnecting from {name}..."
                 self.draw()
-                self.stdscr.refresh()
 
                 if self.bt.disconnect_device(mac):
                     self.status_message = "Disconnected"
@@ -759,13 +1031,11 @@ class BluetoothSettingsScreen(BaseScreen):
 
                     self.status_message = f"Connecting to {name}..."
                     self.draw()
-                    self.stdscr.refresh()
 
                     # Pair if not paired
                     if not paired:
                         self.status_message = "Pairing..."
                         self.draw()
-                        self.stdscr.refresh()
 
                         if not self.bt.pair_device(mac):
                             self.status_message = "Pairing failed"
@@ -783,10 +1053,10 @@ class BluetoothSettingsScreen(BaseScreen):
 
                     self._refresh_devices()
 
-        elif key == curses.KEY_BACKSPACE or key == 127:
+        elif key in _KEYS_BACK:
             return "back"
 
-        elif key == ord('q') or key == ord('Q'):
+        elif key in _KEYS_QUIT:
             return False
 
         return True
@@ -804,7 +1074,7 @@ class BluetoothSettingsScreen(BaseScreen):
 
     def on_select(self):
         # SELECT button: Choose selected option (scan/disconnect/connect)
-        self.handle_input(ord('\n'))
+        self.handle_input(_KEY_ENTER)
         self.draw()
 
     def on_back(self):
@@ -852,39 +1122,12 @@ class ArtistBrowserScreen(BaseScreen):
         if not is_selected or text_width <= max_width:
             return truncate_to_width(text, max_width)
 
-        # Create circular scrolling effect
-        scrolling_text = text + "   " + text  # Add spacing before loop
-
         self.scroll_frame += 1
         if self.scroll_frame >= 8:  # Scroll every 8 frames (~0.8s)
             self.scroll_offset = (self.scroll_offset + 1) % (text_width + 3)
             self.scroll_frame = 0
 
-        # Calculate which part of scrolling_text to show
-        start_offset = self.scroll_offset
-        visible_text = ""
-        current_width = 0
-        char_index = 0
-
-        # Skip to starting offset
-        temp_offset = 0
-        while temp_offset < start_offset and char_index < len(scrolling_text):
-            char = scrolling_text[char_index]
-            char_width = 2 if unicodedata.east_asian_width(char) in ('F', 'W') else 1
-            temp_offset += char_width
-            char_index += 1
-
-        # Collect visible characters
-        while current_width < max_width and char_index < len(scrolling_text):
-            char = scrolling_text[char_index]
-            char_width = 2 if unicodedata.east_asian_width(char) in ('F', 'W') else 1
-            if current_width + char_width > max_width:
-                break
-            visible_text += char
-            current_width += char_width
-            char_index += 1
-
-        return visible_text
+        return _scroll_window(text, self.scroll_offset, max_width)
 
     def get_current_letter(self):
         """Get the letter category for the current artist"""
@@ -962,14 +1205,14 @@ class ArtistBrowserScreen(BaseScreen):
             self.artist_index = self.letter_categories[selected_letter]
             self.letter_selector_mode = False
 
-    def draw(self):
+    def _draw(self):
         # Reset scroll if selection changed
         if self.artist_index != self.last_artist_index:
             self.scroll_offset = 0
             self.scroll_frame = 0
             self.last_artist_index = self.artist_index
 
-        self.stdscr.clear()
+        self._begin_frame()
 
         # Show current letter category in status bar
         if self.letter_selector_mode:
@@ -980,7 +1223,7 @@ class ArtistBrowserScreen(BaseScreen):
         self.draw_status_bar(status_text)
 
         # Draw artists (full width)
-        self.stdscr.addstr(2, 2, "Artists:", curses.A_BOLD)
+        self._put(2, 2, "Artists:", curses.A_BOLD)
 
         # Show letter category indicators on line 3
         if self.category_list:
@@ -988,9 +1231,9 @@ class ArtistBrowserScreen(BaseScreen):
             for idx, letter in enumerate(self.category_list):
                 # Highlight selected letter in selector mode
                 if self.letter_selector_mode and idx == self.selected_letter_index:
-                    self.stdscr.addstr(3, x_pos, letter, curses.color_pair(COLOR_SELECTED) | curses.A_BOLD)
+                    self._put(3, x_pos, letter, self._attr_selected)
                 else:
-                    self.stdscr.addstr(3, x_pos, letter, curses.color_pair(COLOR_NORMAL))
+                    self._put(3, x_pos, letter, self._attr_normal)
                 x_pos += len(letter) + 1  # letter + space
 
                 # Stop if we run out of space
@@ -1024,7 +1267,7 @@ class ArtistBrowserScreen(BaseScreen):
             if show_header:
                 letter = artist_name[0].upper() if artist_name and artist_name[0].isalpha() else '#'
                 # Draw category header
-                self.stdscr.addstr(y, 2, f"--- {letter} ---", curses.A_DIM)
+                self._put(y, 2, f"--- {letter} ---", curses.A_DIM)
                 y += 1
                 if y >= self.height - 2:
                     break
@@ -1035,7 +1278,7 @@ class ArtistBrowserScreen(BaseScreen):
             x_start = 2
 
             # Calculate max width for content
-            max_line_width = self.width - x_start - 2 - display_width(prefix)
+            max_line_width = self.width - x_start - 2 - 2  # prefix is always 2 cells
 
             # Add album count
             count_text = f" ({album_count} albums)"
@@ -1043,12 +1286,12 @@ class ArtistBrowserScreen(BaseScreen):
 
             if is_selected:
                 scrolled_text = self._get_scrolled_text(display_text, max_line_width, True)
-                self.stdscr.addstr(y, x_start, f"{prefix}{scrolled_text}",
-                                 curses.color_pair(COLOR_SELECTED) | curses.A_BOLD)
+                self._put(y, x_start, prefix + scrolled_text,
+                          self._attr_selected)
             else:
                 truncated_text = truncate_to_width(display_text, max_line_width)
-                self.stdscr.addstr(y, x_start, f"{prefix}{truncated_text}",
-                                 curses.color_pair(COLOR_NORMAL))
+                self._put(y, x_start, prefix + truncated_text,
+                          self._attr_normal)
 
             y += 1  # Move to next line for next artist
 
@@ -1057,7 +1300,7 @@ class ArtistBrowserScreen(BaseScreen):
             self.draw_footer("←Letter", "Letter→", "Jump", "Cancel")
         else:
             self.draw_footer("↑", "↓", "Select", "Back")
-        self.stdscr.refresh()
+        self._end_frame()
 
     def handle_input(self, key):
         # In letter selector mode, use different key bindings
@@ -1066,11 +1309,11 @@ class ArtistBrowserScreen(BaseScreen):
                 self.navigate_letter_selector("left")
             elif key == curses.KEY_RIGHT:
                 self.navigate_letter_selector("right")
-            elif key == ord('\n'):  # Enter - jump to selected letter
+            elif key == _KEY_ENTER:  # Enter - jump to selected letter
                 self.jump_to_selected_letter()
-            elif key == curses.KEY_BACKSPACE or key == 127:  # Back - exit selector mode
+            elif key in _KEYS_BACK:  # Back - exit selector mode
                 self.letter_selector_mode = False
-            elif key == ord('q') or key == ord('Q'):
+            elif key in _KEYS_QUIT:
                 return False
         else:
             # Normal artist browsing mode
@@ -1084,13 +1327,13 @@ class ArtistBrowserScreen(BaseScreen):
                 # LEFT/RIGHT toggle letter selector mode
                 self.toggle_letter_selector_mode()
 
-            elif key == ord('\n'):  # Enter
+            elif key == _KEY_ENTER:  # Enter
                 return ("select_artist", self.artists[self.artist_index])
 
-            elif key == curses.KEY_BACKSPACE or key == 127:
+            elif key in _KEYS_BACK:
                 return "back"
 
-            elif key == ord('q') or key == ord('Q'):
+            elif key in _KEYS_QUIT:
                 return False
 
         return True
@@ -1150,52 +1393,25 @@ class PlaylistBrowserScreen(BaseScreen):
         if not is_selected or text_width <= max_width:
             return truncate_to_width(text, max_width)
 
-        # Create circular scrolling effect
-        scrolling_text = text + "   " + text  # Add spacing before loop
-
         self.scroll_frame += 1
         if self.scroll_frame >= 8:  # Scroll every 8 frames (~0.8s)
             self.scroll_offset = (self.scroll_offset + 1) % (text_width + 3)
             self.scroll_frame = 0
 
-        # Calculate which part of scrolling_text to show
-        start_offset = self.scroll_offset
-        visible_text = ""
-        current_width = 0
-        char_index = 0
-
-        # Skip to starting offset
-        temp_offset = 0
-        while temp_offset < start_offset and char_index < len(scrolling_text):
-            char = scrolling_text[char_index]
-            char_width = 2 if unicodedata.east_asian_width(char) in ('F', 'W') else 1
-            temp_offset += char_width
-            char_index += 1
-
-        # Collect visible characters
-        while current_width < max_width and char_index < len(scrolling_text):
-            char = scrolling_text[char_index]
-            char_width = 2 if unicodedata.east_asian_width(char) in ('F', 'W') else 1
-            if current_width + char_width > max_width:
-                break
-            visible_text += char
-            current_width += char_width
-            char_index += 1
-
-        return visible_text
+        return _scroll_window(text, self.scroll_offset, max_width)
 
-    def draw(self):
+    def _draw(self):
         # Reset scroll if selection changed
         if self.playlist_index != self.last_playlist_index:
             self.scroll_offset = 0
             self.scroll_frame = 0
             self.last_playlist_index = self.playlist_index
 
-        self.stdscr.clear()
+        self._begin_frame()
         self.draw_status_bar("Playlists")
 
         # Draw playlists (full width)
-        self.stdscr.addstr(2, 2, "Playlists:", curses.A_BOLD)
+        self._put(2, 2, "Playlists:", curses.A_BOLD)
         start = max(0, self.playlist_index - 5)
         for i in range(start, min(len(self.playlists), start + 10)):
             y = 4 + (i - start)
@@ -1212,7 +1428,7 @@ class PlaylistBrowserScreen(BaseScreen):
             x_start = 2
 
             # Calculate max width for content
-            max_line_width = self.width - x_start - 2 - display_width(prefix)
+            max_line_width = self.width - x_start - 2 - 2  # prefix is always 2 cells
 
             # Add song count
             count_text = f" ({song_count} songs)"
@@ -1220,15 +1436,15 @@ class PlaylistBrowserScreen(BaseScreen):
 
             if is_selected:
                 scrolled_text = self._get_scrolled_text(display_text, max_line_width, True)
-                self.stdscr.addstr(y, x_start, f"{prefix}{scrolled_text}",
-                                 curses.color_pair(COLOR_SELECTED) | curses.A_BOLD)
+                self._put(y, x_start, prefix + scrolled_text,
+                          self._attr_selected)
             else:
                 truncated_text = truncate_to_width(display_text, max_line_width)
-                self.stdscr.addstr(y, x_start, f"{prefix}{truncated_text}",
-                                 curses.color_pair(COLOR_NORMAL))
+                self._put(y, x_start, prefix + truncated_text,
+                          self._attr_normal)
 
         self.draw_footer("↑", "↓", "Select", "Back")
-        self.stdscr.refresh()
+        self._end_frame()
 
     def handle_input(self, key):
         if key == curses.KEY_UP:
@@ -1237,25 +1453,27 @@ class PlaylistBrowserScreen(BaseScreen):
         elif key == curses.KEY_DOWN:
             self.playlist_index = min(len(self.playlists) - 1, self.playlist_index + 1)
 
-        elif key == ord('\n'):  # Enter
+        elif key == _KEY_ENTER:  # Enter
             return ("select_playlist", self.playlists[self.playlist_index])
 
-        elif key == curses.KEY_BACKSPACE or key == 127:
+        elif key in _KEYS_BACK:
             return "back"
 
-        elif key == ord('q') or key == ord('Q'):
+        elif key in _KEYS_QUIT:
             return False
 
         return True
 
     # Button support
     def on_up(self):
-        self.playlist_index = max(0, self.playlist_index - 1)
-        self.draw()
+        if self.playlist_index > 0:
+            self.playlist_index -= 1
+            self.draw()
 
     def on_down(self):
-        self.playlist_index = min(len(self.playlists) - 1, self.playlist_index + 1)
-        self.draw()
+        if self.playlist_index < len(self.playlists) - 1:
+            self.playlist_index += 1
+            self.draw()
 
     def on_select(self):
         self._pending_action = ("select_playlist", self.playlists[self.playlist_index])
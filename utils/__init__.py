@@ -1,14 +1,10 @@
 """Utility modules for Music Player"""
 
+from . import logger as _logger
 from .logger import (
     get_logger,
     log_startup,
-    log_shutdown,
-    main_logger,
-    audio_logger,
-    ui_logger,
-    hardware_logger,
-    network_logger
+    log_shutdown
 )
 
 __all__ = [
@@ -21,3 +17,7 @@ __all__ = [
     "hardware_logger",
     "network_logger"
 ]
+
+def __getattr__(name):
+    """Component loggers (main_logger, ...) are created on first access"""
+    return getattr(_logger, name)
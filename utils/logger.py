@@ -3,8 +3,11 @@ Centralized logging system for Music Player application
 Provides structured logging with rotation and different log levels
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
@@ -23,8 +26,43 @@ NETWORK_LOG = LOG_DIR / "network.log"
 LOG_FORMAT = "%(asctime)s | %(name)s | %(levelname)s | %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-# Create formatters
-formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that runs strftime once per second rather than per record"""
+
+    _last_second = None
+    _last_time = ""
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_time = super().formatTime(record, datefmt)
+            self._last_second = second
+        return self._last_time
+
+# Create formatters (only the listener thread formats, so the cache is unshared)
+formatter = _CachedTimeFormatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+
+
+class _RouteHandler(logging.Handler):
+    """Hands each queued record to the file handler of the logger that made it"""
+
+    def __init__(self):
+        super().__init__()
+        self.routes = {}  # logger name -> file handler
+
+    def handle(self, record):
+        handler = self.routes.get(record.name)
+        if handler is not None:
+            handler.handle(record)
+
+
+# Loggers only enqueue records; a background thread does the file writes
+# (and rotation), so logging never blocks the UI or audio threads
+_log_queue = queue.SimpleQueue()
+_router = _RouteHandler()
+_listener = logging.handlers.QueueListener(_log_queue, _router)
+_listener.start()
+atexit.register(_listener.stop)  # Flush what's still queued on exit
 
 def setup_logger(name, log_file, level=logging.INFO):
     """
@@ -51,22 +89,42 @@ def setup_logger(name, log_file, level=logging.INFO):
         backupCount=3
     )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    old_handler = _router.routes.get(name)
+    _router.routes[name] = file_handler
+    if old_handler is not None:
+        old_handler.close()
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
 
     # Prevent propagation to root logger
     logger.propagate = False
 
     return logger
 
-# Pre-configured loggers for different components
-main_logger = setup_logger("main", MAIN_LOG, level=logging.INFO)
-audio_logger = setup_logger("audio", AUDIO_LOG, level=logging.DEBUG)
-ui_logger = setup_logger("ui", UI_LOG, level=logging.INFO)
-hardware_logger = setup_logger("hardware", HARDWARE_LOG, level=logging.INFO)
-network_logger = setup_logger("network", NETWORK_LOG, level=logging.DEBUG)
+# Log file and level for each component. Loggers (and their file
+# handlers) are only created the first time a component asks for one.
+_COMPONENTS = {
+    "main": (MAIN_LOG, logging.INFO),
+    "audio": (AUDIO_LOG, logging.DEBUG),
+    "ui": (UI_LOG, logging.INFO),
+    "hardware": (HARDWARE_LOG, logging.INFO),
+    "network": (NETWORK_LOG, logging.DEBUG),
+}
+
+@lru_cache(maxsize=None)
+def _component_logger(component):
+    """Set up a component's logger on first use"""
+    log_file, level = _COMPONENTS[component]
+    return setup_logger(component, log_file, level=level)
+
+def __getattr__(name):
+    """main_logger, audio_logger, ... - created on first access (PEP 562)"""
+    if name.endswith("_logger") and name[:-len("_logger")] in _COMPONENTS:
+        return _component_logger(name[:-len("_logger")])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def log_startup():
     """Log application startup"""
+    main_logger = get_logger("main")
     main_logger.info("=" * 60)
     main_logger.info("Music Player Application Started")
     main_logger.info(f"Timestamp: {datetime.now()}")
@@ -74,6 +132,7 @@ def log_startup():
 
 def log_shutdown():
     """Log application shutdown"""
+    main_logger = get_logger("main")
     main_logger.info("=" * 60)
     main_logger.info("Music Player Application Shutdown")
     main_logger.info(f"Timestamp: {datetime.now()}")
@@ -89,11 +148,6 @@ def get_logger(component):
     Returns:
         Logger instance
     """
-    loggers = {
-        "main": main_logger,
-        "audio": audio_logger,
-        "ui": ui_logger,
-        "hardware": hardware_logger,
-        "network": network_logger
-    }
-    return loggers.get(component, main_logger)
+    if component not in _COMPONENTS:
+        component = "main"
+    return _component_logger(component)